@@ -6,7 +6,6 @@ import re
 import json
 import numpy as np
 import uuid
-import pickle
 import hashlib
 import difflib
 from datetime import datetime, date
@@ -68,11 +67,9 @@ else:
         print("⚠️ DATABASE_URL not set. Family context endpoints will be disabled.")
 
 # ── Knowledge base (embeddings already prepared) ───────────────────────────
-with open("kb_chunks/kb_chunks.pkl", "rb") as f:
-    kb_chunks = pickle.load(f)
+from kb_store import load_kb
 
-EMBEDDINGS = np.array([chunk["embedding"] for chunk in kb_chunks], dtype=np.float32)
-METADATA = kb_chunks
+METADATA, EMBEDDINGS = load_kb("kb_chunks/kb_chunks")
 
 # Debug + validation
 print("KB embeddings shape:", EMBEDDINGS.shape, flush=True)
@@ -449,7 +446,8 @@ def log_interaction_to_db(family_id: str, question: str, answer: str, metadata:
         print(f"Failed to log interaction: {e}")
 
 # ── Enhanced Answer Logic ──────────────────────────────────────────────────
-from static_qa_config import STATIC_QA_LIST as STATIC_QAS
+# Module import only: the policy entries load on first lookup, not at startup
+import static_qa_config as static_qa
 from contextualButtons import get_suggestions
 from language_engine import translate
 
@@ -511,51 +509,47 @@ def find_best_answer(question, language='en', session_id=None, family_id=None):
     else:
         tracker = ConversationTracker(str(uuid.uuid4()), family_id)
 
-    # Static exact match
-    for qa in STATIC_QAS:
-        if qa['language'] != language:
-            continue
-        variants = [qa['key']] + qa.get('variants', [])
-        if q_lower in [v.lower() for v in variants]:
-            print(f"✅ Exact match on: {qa['key']}")
-            answer = qa['answer']
-            
-            # Track interaction
-            tracker.add_interaction(question, answer, qa['key'])
+    # Static exact match (static QA entries are all in static_qa.LANGUAGE)
+    qa = static_qa.resolve(q_lower) if language == static_qa.LANGUAGE else None
+    if qa:
+        print(f"✅ Exact match on: {qa.key}")
+        answer = static_qa.ANSWER_TEXT.get(qa.key, qa.answer)
+        
+        # Track interaction
+        tracker.add_interaction(question, answer, qa.key)
+        
+        # Enhance for voice
+        if session_id:  # Only enhance for voice sessions
+            family_ctx = fetch_family_context(family_id) if family_id else None
+            answer = response_enhancer.enhance_for_voice(answer, tracker, family_ctx)
             
-            # Enhance for voice
-            if session_id:  # Only enhance for voice sessions
-                family_ctx = fetch_family_context(family_id) if family_id else None
-                answer = response_enhancer.enhance_for_voice(answer, tracker, family_ctx)
-                
-            return answer, qa.get('url'), qa.get('label'), qa['key'], "static"
+        return answer, qa.url, qa.label, qa.key, "static"
 
     # Fuzzy static match
     best_score = 0
     best_match = None
-    for qa in STATIC_QAS:
-        if qa['language'] != language:
-            continue
-        variants = [qa['key']] + qa.get('variants', [])
-        for var in variants:
-            score = difflib.SequenceMatcher(None, q_lower, var.lower()).ratio()
-            if score > best_score:
-                best_score = score
-                best_match = qa
+    # VARIANT_INDEX holds every lowercased key/variant once, in entry order
+    static_phrases = static_qa.VARIANT_INDEX.items() if language == static_qa.LANGUAGE else ()
+    for var, i in static_phrases:
+        score = difflib.SequenceMatcher(None, q_lower, var).ratio()
+        if score > best_score:
+            best_score = score
+            best_match = i
                 
-    if best_match and best_score > 0.8:
-        print(f"🟡 Fuzzy match on: {best_match['key']} (score {best_score:.2f})")
-        answer = best_match['answer']
+    if best_match is not None and best_score > 0.8:
+        qa = static_qa.get_entry(best_match)
+        print(f"🟡 Fuzzy match on: {qa.key} (score {best_score:.2f})")
+        answer = static_qa.ANSWER_TEXT.get(qa.key, qa.answer)
         
         # Track interaction
-        tracker.add_interaction(question, answer, best_match['key'])
+        tracker.add_interaction(question, answer, qa.key)
         
         # Enhance for voice
         if session_id:
             family_ctx = fetch_family_context(family_id) if family_id else None
             answer = response_enhancer.enhance_for_voice(answer, tracker, family_ctx)
             
-        return answer, best_match.get('url'), best_match.get('label'), best_match['key'], "fuzzy"
+        return answer, qa.url, qa.label, qa.key, "fuzzy"
 
     # RAG fallback with GPT summarisation
     sims, idxs = vector_search(question)
@@ -1,4 +1,4 @@
-from static_qa_config import STATIC_QA_LIST  # Import the correct list
+import static_qa_config as static_qa
 from difflib import SequenceMatcher
 
 RELATED_TOPICS = {
@@ -45,15 +45,13 @@ def get_suggestions(user_input, language='en'):
     print(f"🔍 get_suggestions called with: '{user_input}' | Language: {language}")
 
     # Fuzzy match the input to known keys/variants
-    for qa in STATIC_QA_LIST:  # Use the correct list variable
-        if qa['language'] != language:
-            continue
-        variants = [qa['key']] + qa.get('variants', [])
-        for variant in variants:
-            score = SequenceMatcher(None, user_input, variant.lower()).ratio()
-            if score > best_score:
-                best_score = score
-                best_key = qa['key']
+    # VARIANT_INDEX holds every lowercased key/variant once, in entry order
+    static_phrases = static_qa.VARIANT_INDEX.items() if language == static_qa.LANGUAGE else ()
+    for variant, i in static_phrases:
+        score = SequenceMatcher(None, user_input, variant).ratio()
+        if score > best_score:
+            best_score = score
+            best_key = static_qa.KEYS[i]
 
     print(f"🎯 Best match: '{best_key}' with score {best_score:.2f}")
 
@@ -75,10 +73,9 @@ def get_suggestions(user_input, language='en'):
     buttons = []
     for key in final_keys:
         # Find the matching QA entry
-        match = next((q for q in STATIC_QA_LIST if q['key'] == key and q['language'] == language), None)
-        if match:
-            # Use the 'label' field if it exists, otherwise use the key
-            label = match.get('label', key.title())
+        match = static_qa.KEY_INDEX.get(key) if language == static_qa.LANGUAGE else None
+        if match is not None:
+            label = static_qa.LABELS[match]
             buttons.append({'label': label, 'query': key})
             print(f"✅ Added button: {label} -> {key}")
         else:
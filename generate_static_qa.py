@@ -7,7 +7,9 @@ AGGRESSIVE static QA generator:
   * All 'policy-like' items (prefers PDFs, falls back to HTML)
   * All sport pages (per a configurable sports catalogue)
 
-Outputs a ready-to-use static_qa_config.py with British English copy.
+Outputs a ready-to-use static_qa_config.py with British English copy. The
+generated module holds data only; its lookups come from static_qa_runtime.py,
+which must sit next to it (or on the import path).
 
 Usage (Cheltenham example):
   python generate_static_qa.py \
@@ -19,9 +21,14 @@ Usage (Cheltenham example):
     --exclude-prep
 """
 
-import os, re, argparse, pickle, importlib.util, textwrap
+import os, re, ast, argparse, pickle, hashlib, importlib.util, textwrap
+from functools import lru_cache
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple, Union
+
+import numpy as np
+
+from static_qa_runtime import normalise
 
 # -----------------------
 # Configurable Catalogues
@@ -73,11 +80,55 @@ EXCLUDE_PATH_HINTS = [
     "/the-prep", "/prep", "pre-prep", "/nursery", "/early-years"
 ]
 
+# Single-pass matcher for the exclude hints above (match against lowercased URLs)
+_EXCLUDE_RX = re.compile("|".join(re.escape(h) for h in EXCLUDE_PATH_HINTS))
+
+# Label clean-up patterns (compiled once, used per record)
+_EXT_RX = re.compile(r"\s*\b(pdf|docx?)\b\s*$", re.I)
+_POLICY_WORD_RX = re.compile(r"\bpolicy\b", re.I)
+_REPORT_RX = re.compile(r"\breport\b", re.I)
+_SPACES_RX = re.compile(r"\s{2,}")
+
+# Words kept lower-case when title-casing labels
+_MINOR_WORDS = frozenset({"and", "of", "for", "to", "in", "on", "with"})
+
 # -----------------------
 # Utility helpers
 # -----------------------
 
-def import_url_mapping(mapping_path: str) -> Dict[str, str]:
+def _literal_url_mapping(source: str):
+    """
+    Return URL_MAPPING if the module assigns it a plain dict literal, else None.
+    Avoids compiling/executing the mapping file for the common generated case.
+    """
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return None
+    for node in tree.body:
+        if isinstance(node, ast.Assign):
+            targets, value = node.targets, node.value
+        elif isinstance(node, ast.AnnAssign) and node.value is not None:
+            targets, value = [node.target], node.value
+        else:
+            continue
+        if any(isinstance(t, ast.Name) and t.id == "URL_MAPPING" for t in targets):
+            try:
+                mapping = ast.literal_eval(value)
+            except ValueError:
+                return None
+            return mapping if isinstance(mapping, dict) else None
+    return None
+
+@lru_cache(maxsize=None)
+def _load_url_mapping(mapping_path: str, mtime: float) -> Dict[str, str]:
+    # mtime is part of the cache key so an edited mapping file is re-read
+    with open(mapping_path, "r", encoding="utf-8") as f:
+        mapping = _literal_url_mapping(f.read())
+    if mapping is not None:
+        return mapping
+
+    # Fall back to importing modules that build the mapping dynamically
     spec = importlib.util.spec_from_file_location("url_mapping", mapping_path)
     if not spec or not spec.loader:
         raise RuntimeError(f"Failed to import {mapping_path}")
@@ -85,29 +136,47 @@ def import_url_mapping(mapping_path: str) -> Dict[str, str]:
     spec.loader.exec_module(mod)
     return getattr(mod, "URL_MAPPING", {})
 
-def load_metadata(pkl_path: str) -> List[dict]:
+def import_url_mapping(mapping_path: str) -> Dict[str, str]:
+    path = os.path.abspath(mapping_path)
+    # Copy so callers can't mutate the cached dict between schools
+    return dict(_load_url_mapping(path, os.path.getmtime(path)))
+
+def iter_metadata(pkl_path: str) -> Iterator[dict]:
+    """
+    Yield normalised {url, title, text} records from metadata.pkl, skipping
+    records without a URL. Avoids holding a second, normalised copy in memory.
+    """
     with open(pkl_path, "rb") as f:
         data = pickle.load(f)
 
     if isinstance(data, dict):
-        recs = list(data.values())
+        recs = data.values()
     elif isinstance(data, list):
         recs = data
     else:
         raise ValueError("Unsupported metadata format; expected list or dict")
 
-    norm = []
     for r in recs:
         url = r.get("url") or r.get("source_url") or r.get("page_url")
+        if not url:
+            continue
         title = (r.get("title") or r.get("page_title") or r.get("label") or "").strip()
         text = (r.get("text") or "").strip()
-        if url:
-            norm.append({"url": url.strip(), "title": title, "text": text})
-    return norm
+        yield {"url": url.strip(), "title": title, "text": text}
+
+def load_metadata(pkl_path: str) -> List[dict]:
+    return list(iter_metadata(pkl_path))
 
 def is_pdf(url: str) -> bool:
     return url.lower().split("?")[0].endswith(".pdf")
 
+def normalise_variants(variants: Iterable[str]) -> Tuple[str, ...]:
+    """
+    Variants in the form static_qa_runtime.normalise() puts queries in
+    (lowercase, whitespace runs collapsed), dropping blanks and repeats.
+    """
+    return tuple(dict.fromkeys(p for p in map(normalise, variants) if p))
+
 def normalise_url(u: str) -> str:
     # Strip fragment & query for canonicalisation
     from urllib.parse import urlsplit, urlunsplit
@@ -120,8 +189,14 @@ def contains_any(s: str, needles: List[str]) -> bool:
     return any(n in s2 for n in needles)
 
 def looks_like_policy(title: str, path: str, filename: str) -> bool:
-    hay = " ".join([title.lower(), path.lower(), filename.lower()])
-    return contains_any(hay, POLICY_HINTS)
+    # path is the record's URL and unique per record, so only the title and
+    # filename check below is worth caching
+    return contains_any(path, POLICY_HINTS) or _title_looks_like_policy(title, filename)
+
+@lru_cache(maxsize=8192)
+def _title_looks_like_policy(title: str, filename: str) -> bool:
+    # Pure on its string args; titles/filenames repeat across site sections
+    return contains_any(title + " " + filename, POLICY_HINTS)
 
 def pick(mapping: Dict[str, str], candidates: List[str], default: str) -> str:
     if not mapping:
@@ -130,7 +205,7 @@ def pick(mapping: Dict[str, str], candidates: List[str], default: str) -> str:
     for c in candidates:
         u = lower_map.get(c.lower())
         if u:
-            if any(h in u.lower() for h in EXCLUDE_PATH_HINTS):
+            if _EXCLUDE_RX.search(u.lower()):
                 continue
             return u
     return default
@@ -138,6 +213,24 @@ def pick(mapping: Dict[str, str], candidates: List[str], default: str) -> str:
 def L(page_links: Dict[str, str], key: str, site_root: str) -> str:
     return page_links.get(key, site_root)
 
+def best_candidate(urls: Sequence[str], pdfs: Sequence[bool], prefs: Sequence[bool]) -> str:
+    """
+    Pick the best URL from parallel candidate arrays in one vectorised pass.
+    Ranking: PDFs first, then highest score (short URL, PDF, preferred domain),
+    then the shortest URL as a tie-break.
+    """
+    lengths = np.fromiter((len(u) for u in urls), dtype=np.int32, count=len(urls))
+    is_pdf_arr = np.array(pdfs, dtype=bool)
+    prefer = np.array(prefs, dtype=bool)
+    scores = np.maximum(0, 120 - lengths) + 2 * is_pdf_arr + prefer
+    # Linear selection (no sort): restrict to PDFs if any, take the top score,
+    # then the shortest URL among those; ties resolve to the earliest candidate.
+    pool = is_pdf_arr if is_pdf_arr.any() else np.ones(len(urls), dtype=bool)
+    ranked = np.where(pool, scores, -1)
+    top = np.flatnonzero(ranked == ranked.max())
+    idx = top[np.argmin(lengths[top])]
+    return urls[idx]
+
 def dedupe_preserve_order(items: List[Tuple[str, dict]]) -> List[Tuple[str, dict]]:
     seen = set()
     out = []
@@ -230,101 +323,90 @@ def core_static_items(school: str) -> List[Tuple[str, dict]]:
     return items
 
 # -----------------------
-# AUTO: discover policies
+# AUTO: discover policies + sports
 # -----------------------
 
-def discover_policies(records: List[dict], exclude_prep: bool, prefer_domain: str = "") -> Dict[str, str]:
+def policy_label(url: str, title: str, fname: str) -> str:
+    """
+    Prettify a policy label from title/filename, e.g., "First Aid Policy".
     """
-    Return {policy_label: url}. Prefers PDFs; falls back to HTML if needed.
-    Policy label is prettified from title/filename, e.g., "First Aid Policy".
+    label = title.strip()
+    if not label:
+        # derive from filename
+        label = os.path.splitext(os.path.basename(url))[0]
+        label = label.replace("_", " ").replace("-", " ").strip()
+
+    # normalise label to title case, ensure 'Policy' suffix where appropriate
+    base = _EXT_RX.sub("", label).strip()
+    # If it already contains 'policy', leave; else add if it looks like a policy-ish doc
+    if not _POLICY_WORD_RX.search(base) and looks_like_policy(base, url, fname):
+        # don't force 'Policy' onto reports like ISI; just leave as-is if 'report' present
+        if not _REPORT_RX.search(base):
+            base = base + " Policy"
+
+    # Clean multiple spaces, title-case lightly (preserve common acronyms)
+    base = _SPACES_RX.sub(" ", base)
+    # Capitalise first letter of words except minor ones
+    base = " ".join(w.capitalize() if w.lower() not in _MINOR_WORDS else w.lower() for w in base.split())
+    return base
+
+def discover_all(records: Iterable[dict], exclude_prep: bool, prefer_domain: str = "") -> Tuple[Dict[str, str], Dict[str, str]]:
     """
-    candidates = defaultdict(list)  # key → list[(url, score, is_pdf)]
+    Single sweep over records returning ({policy_label: url}, {sport_label: url}).
+    Policies prefer PDFs and fall back to HTML; sports prefer HTML pages (not PDFs).
+    """
+    candidates = defaultdict(list)  # policy key → list[(url, is_pdf, prefer)]
+    by_sport = defaultdict(list)    # sport key → list[(url, prefer)]
+    pref = prefer_domain.lower() if prefer_domain else ""
+
     for r in records:
         url = normalise_url(r["url"])
-        title = r["title"] or ""
-        path = url
-        if exclude_prep and any(h in url.lower() for h in EXCLUDE_PATH_HINTS):
+        url_l = url.lower()
+        if exclude_prep and _EXCLUDE_RX.search(url_l):
             continue
 
-        # Only consider pages that *look* like policies or PDFs that are clearly policies
-        fname = os.path.basename(url.lower())
+        title = r["title"] or ""
+        fname = os.path.basename(url_l)
         pdf = is_pdf(url)
-        if not (pdf or looks_like_policy(title, path, fname)):
-            continue
-
-        # Build a display label
-        label = title.strip()
-        if not label:
-            # derive from filename
-            label = os.path.splitext(os.path.basename(url))[0]
-            label = label.replace("_", " ").replace("-", " ").strip()
-
-        # normalise label to title case, ensure 'Policy' suffix where appropriate
-        base = re.sub(r"\s*\b(pdf|docx?)\b\s*$", "", label, flags=re.I).strip()
-        # If it already contains 'policy', leave; else add if it looks like a policy-ish doc
-        if not re.search(r"\bpolicy\b", base, flags=re.I) and looks_like_policy(base, path, fname):
-            # don't force 'Policy' onto reports like ISI; just leave as-is if 'report' present
-            if not re.search(r"\breport\b", base, flags=re.I):
-                base = base + " Policy"
-
-        # Clean multiple spaces, title-case lightly (preserve common acronyms)
-        base = re.sub(r"\s{2,}", " ", base)
-        # Capitalise first letter of words except minor ones
-        base = " ".join(w.capitalize() if w.lower() not in {"and","of","for","to","in","on","with"} else w.lower() for w in base.split())
-
-        # Score: favour PDFs and shorter URLs
-        score = (2.0 if pdf else 0.0) + max(0, 120 - len(url))
-        # Prefer on-site domain
-        if prefer_domain and prefer_domain in url.lower():
-            score += 1.0
-
-        candidates[base].append((url, score, pdf))
-
-    chosen = {}
+        # Prefer on-site domain (scored with URL length in best_candidate)
+        prefer = bool(pref) and pref in url_l
+
+        # Policies: only pages that *look* like policies, or PDFs
+        if pdf or looks_like_policy(title, url, fname):
+            candidates[policy_label(url, title, fname)].append((url, pdf, prefer))
+
+        # Sports: prefer non-PDF pages
+        if not pdf:
+            text = r["text"] or ""
+            hay = " ".join([url_l, title.lower(), text.lower()[:500]])
+            for sport, needles in SPORT_KEYWORDS.items():
+                if contains_any(hay, [n.lower() for n in needles]):
+                    by_sport[sport].append((url, prefer))
+
+    policies = {}
     for label, items in candidates.items():
         # Prefer PDFs first; then highest score
-        pdfs = [it for it in items if it[2]]
-        pool = pdfs if pdfs else items
-        best = sorted(pool, key=lambda x: (-x[1], len(x[0])))[0]
-        chosen[label] = best[0]
-    return chosen
-
-# -----------------------
-# AUTO: discover sports
-# -----------------------
-
-def discover_sports(records: List[dict], exclude_prep: bool, prefer_domain: str = "") -> Dict[str, str]:
-    """
-    Return {sport_label: url} for each sport in SPORT_KEYWORDS that exists on site.
-    Prefers HTML pages (not PDFs).
-    """
-    found = {}
-    by_sport = defaultdict(list)
-
-    for r in records:
-        url = normalise_url(r["url"])
-        title = r["title"] or ""
-        text = r["text"] or ""
-        if exclude_prep and any(h in url.lower() for h in EXCLUDE_PATH_HINTS):
-            continue
-        if is_pdf(url):
-            continue  # prefer non-PDF for sport
-
-        hay = " ".join([url.lower(), title.lower(), text.lower()[:500]])
-        for sport, needles in SPORT_KEYWORDS.items():
-            if contains_any(hay, [n.lower() for n in needles]):
-                # score: prefer on-site + shorter path
-                score = max(0, 120 - len(url))
-                if prefer_domain and prefer_domain in url.lower():
-                    score += 1.0
-                by_sport[sport].append((url, score))
+        urls, pdfs, prefs = zip(*items)
+        policies[label] = best_candidate(urls, pdfs, prefs)
 
+    sports = {}
     for sport, items in by_sport.items():
-        best = sorted(items, key=lambda x: (-x[1], len(x[0])))[0]
+        urls, prefs = zip(*items)
+        # PDFs are skipped above, so rank on score + URL length only
+        best = best_candidate(urls, [False] * len(urls), prefs)
         # Prettify label: capitalise words
         label = " ".join(w.capitalize() for w in sport.split())
-        found[label] = best[0]
-    return found
+        sports[label] = best
+
+    return policies, sports
+
+def discover_policies(records: List[dict], exclude_prep: bool, prefer_domain: str = "") -> Dict[str, str]:
+    """Return {policy_label: url}. Prefer discover_all() when sports are needed too."""
+    return discover_all(records, exclude_prep, prefer_domain)[0]
+
+def discover_sports(records: List[dict], exclude_prep: bool, prefer_domain: str = "") -> Dict[str, str]:
+    """Return {sport_label: url}. Prefer discover_all() when policies are needed too."""
+    return discover_all(records, exclude_prep, prefer_domain)[1]
 
 # -----------------------
 # Render final file
@@ -332,87 +414,245 @@ def discover_sports(records: List[dict], exclude_prep: bool, prefer_domain: str
 
 HEADER_TEMPLATE = """# {school} – Static QA config (AUTO-GENERATED, aggressive)
 # Do not edit by hand. Re-run generate_static_qa.py to refresh.
-from typing import Dict, List
+# Every variant is already in normalise() form -- lowercase, single-spaced,
+# no surrounding whitespace -- since the generator normalises them, so
+# matchers normalise the query only, never the variants.
+import os
+from functools import cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple, Union
 
-SITE_ROOT = "{site_root}"
+from static_qa_runtime import StaticQA, StaticQATable, normalise  # noqa: F401 (re-exported)
 
+SITE_ROOT = "{site_root}"
+{url_constants_block}
 # url_mapping anchors (core pages). Auto-generated from mapping + defaults in generator.
-PAGE_LINKS: Dict[str, str] = {{
+# Read-only view: L() below caches its results, which is only sound while
+# nothing can change the mapping underneath it.
+PAGE_LINKS: Mapping[str, str] = MappingProxyType({{
 {page_links_block}
-}}
+}})
 
+# Callers resolve the same few keys over and over; PAGE_LINKS never changes
+# after import, so each result is computed once.
+@cache
 def L(key: str) -> str:
     return PAGE_LINKS.get(key, SITE_ROOT)
 
 """
 
-def make_page_links_block(page_links: Dict[str, str]) -> str:
+# A directory prefix (scheme, host and first two path segments, e.g. the S3
+# wp-content/uploads/ bucket every policy PDF lives in) gets its own constant
+# once this many URLs that aren't hoisted whole share it.
+PREFIX_MIN_USES = 3
+
+def _constant_name(kind: str, url: str, taken: set) -> str:
+    # Named after the last path segment: _URL_MODERN_SLAVERY_STATEMENT_PDF, _PREFIX_UPLOADS
+    segment = url.rstrip("/").rsplit("/", 1)[-1] if url.rstrip("/").count("/") > 2 else "root"
+    name = f"_{kind}_" + (re.sub(r"[^A-Za-z0-9]+", "_", segment).strip("_").upper() or "ROOT")
+    base, n = name, 2
+    while name in taken:
+        name, n = f"{base}_{n}", n + 1
+    taken.add(name)
+    return name
+
+def _directory_prefix(url: str) -> Optional[str]:
+    m = re.match(r"(https?://[^/]+/[^/]+/[^/]+/)(?=.)", url)
+    return m.group(1) if m else None
+
+def hoist_urls(urls: Iterable[str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Decide how each URL is written so repeated text is defined once:
+      * a URL that occurs more than once (e.g. the Modern Slavery Statement PDF
+        several policy links fall back to) becomes a constant of its own;
+      * other URLs under a common directory prefix are written as
+        PREFIX_CONSTANT + "rest".
+    Returns (url -> Python expression for URLs not written as a plain literal,
+    constant name -> value).
+    """
+    counts = defaultdict(int)
+    for u in urls:
+        counts[u] += 1
+
+    exprs: Dict[str, str] = {}
+    constants: Dict[str, str] = {}
+    taken = set()
+    for u in sorted(u for u, n in counts.items() if n > 1):
+        name = _constant_name("URL", u, taken)
+        constants[name] = u
+        exprs[u] = name
+
+    prefix_uses = defaultdict(int)
+    for u in counts:
+        if u not in exprs and _directory_prefix(u):
+            prefix_uses[_directory_prefix(u)] += 1
+    for p in sorted(p for p, n in prefix_uses.items() if n >= PREFIX_MIN_USES):
+        name = _constant_name("PREFIX", p, taken)
+        constants[name] = p
+        for u in counts:
+            if u not in exprs and _directory_prefix(u) == p:
+                exprs[u] = f'{name} + "{esc(u[len(p):])}"'
+    return exprs, constants
+
+def make_url_constants_block(url_constants: Dict[str, str]) -> str:
+    if not url_constants:
+        return ""
+    lines = ["", "# URLs and URL prefixes shared by several links/entries below, defined once"]
+    for name, u in sorted(url_constants.items()):
+        lines.append(f'{name} = "{esc(u)}"')
+    return "\n".join(lines) + "\n"
+
+def url_literal(url: str, url_exprs: Dict[str, str]) -> str:
+    return url_exprs.get(url) or f'"{esc(url)}"'
+
+def make_page_links_block(page_links: Dict[str, str], url_exprs: Dict[str, str]) -> str:
     lines = []
     for k in sorted(page_links.keys()):
         v = page_links[k]
-        lines.append(f'    "{k}": "{v}",')
+        lines.append(f'    "{k}": {url_literal(v, url_exprs)},')
     return "\n".join(lines)
 
-def make_item_block(key: str, url_key_or_url: str, answer: str, label: str, variants: List[str], direct_url: bool=False) -> str:
+def url_prefix_table(urls: Iterable[str], whole: Iterable[str]) -> Tuple[str, ...]:
     """
-    If direct_url is False, url_key_or_url is a PAGE_LINKS key passed via L("key").
-    If direct_url is True, url_key_or_url is a literal URL string.
+    URL_PREFIXES: the empty prefix, then each directory prefix shared by at
+    least PREFIX_MIN_USES of urls. URLs in whole are kept intact (they are
+    already constants shared with PAGE_LINKS) and don't count.
     """
-    url_field = (f'L("{url_key_or_url}")' if not direct_url else f'"{url_key_or_url}"')
-    # Escape double quotes in strings
-    def esc(s): return s.replace('"', '\\"')
-    variants_list = "[" + ", ".join([f'"{esc(v)}"' for v in variants]) + "]"
-    return (
-f'''    {{
-        "key": "{esc(key)}",
-        "language": "en",
-        "answer": "{esc(answer)}",
-        "url": {url_field},
-        "label": "{esc(label)}",
-        "variants": {variants_list}
-    }},'''
-    )
+    whole = set(whole)
+    uses = defaultdict(int)
+    for u in set(urls) - whole:
+        if _directory_prefix(u):
+            uses[_directory_prefix(u)] += 1
+    return ("",) + tuple(sorted(p for p, n in uses.items() if n >= PREFIX_MIN_USES))
+
+def split_url(url: str, prefixes: Sequence[str], whole: Iterable[str]) -> Tuple[int, str]:
+    """(prefix id, suffix) for url against url_prefix_table's prefixes."""
+    p = _directory_prefix(url)
+    if url in whole or p not in prefixes:
+        return 0, url
+    return prefixes.index(p), url[len(p):]
+
+# Every entry is British English copy, so language is one module constant
+# rather than a column.
+LANGUAGE = "en"
+
+# Boilerplate answers: every auto-discovered policy uses the first, every sport
+# the second. Entries whose answer is exactly one of them (for their label) are
+# emitted as the template's position and rebuilt from the label on read.
+ANSWER_TEMPLATES = ("Read the {label}.", "Find information about {label} at {school}.")
+
+def answer_templates(school: str) -> Tuple[str, ...]:
+    """ANSWER_TEMPLATES for one school, leaving {label} to fill in per entry."""
+    return tuple(t.replace("{school}", school) for t in ANSWER_TEMPLATES)
+
+def compact_answers(
+    answers: Iterable[str], labels: Iterable[str], templates: Sequence[str]
+) -> Tuple[Union[str, int], ...]:
+    """ANSWERS column with boilerplate answers replaced by their index in templates."""
+    column: List[Union[str, int]] = []
+    for a, l in zip(answers, labels):
+        column.append(next((t for t, tpl in enumerate(templates) if a == tpl.format(label=l)), a))
+    return tuple(column)
+
+# Policy PDF entries make up most of the file but are rarely needed, so they
+# go in their own module that static_qa_config only imports on demand.
+POLICY_PREFIX = "policy::"
+
+def policies_module_name(config_path: str) -> str:
+    """
+    Module name of the policy shard for the config at config_path, derived
+    from its name so configs generated into one directory (one per school)
+    each keep their own shard: static_qa_config.py -> static_qa_policies,
+    cheltenham.py -> cheltenham_policies.
+    """
+    stem = os.path.splitext(os.path.basename(config_path))[0]
+    return (stem[:-len("_config")] if stem.endswith("_config") else stem) + "_policies"
 
-def render_static_qa(
-    school: str,
-    site_root: str,
-    url_mapping: Dict[str, str],
-    records: List[dict],
-    exclude_prep: bool,
-    prefer_domain: str
-) -> str:
+POLICIES_HEADER_TEMPLATE = """# {school} – Static QA policy entries (AUTO-GENERATED, aggressive)
+# Do not edit by hand. Re-run generate_static_qa.py to refresh.
+# Appended to the core entries by {config_module} on first use.
+from typing import Tuple, Union
 
-    # 1) Core page links + curated items
-    page_links = core_page_links(url_mapping, site_root, school)
-    curated = core_static_items(school)
+"""
 
-    # 2) Auto-discovered policies (key = clean label e.g. "First Aid Policy")
-    policy_map = discover_policies(records, exclude_prep=exclude_prep, prefer_domain=prefer_domain)
+FOOTER_TEMPLATE = """
+# Lookups, matching and the lazily built full columns (KEYS, VARIANT_INDEX, ...)
+# live in static_qa_runtime; this module only supplies the data.
+_TABLE = StaticQATable(
+    __name__,
+    os.path.dirname(os.path.abspath(__file__)),
+    core={
+        "KEYS": CORE_KEYS,
+        "ANSWERS": CORE_ANSWERS,
+        "URL_PREFIX_IDS": CORE_URL_PREFIX_IDS,
+        "URL_SUFFIXES": CORE_URL_SUFFIXES,
+        "LABELS": CORE_LABELS,
+        "VARIANTS_BLOB": CORE_VARIANTS_BLOB,
+        "VARIANT_OFFSETS": CORE_VARIANT_OFFSETS,
+    },
+    shards=_SHARDS,
+    url_prefixes=URL_PREFIXES,
+    answer_templates=ANSWER_TEMPLATES,
+    language=LANGUAGE,
+)
+
+get_entry = _TABLE.get_entry
+entry = _TABLE.entry
+get_language = _TABLE.get_language
+answer_of = _TABLE.answer_of
+variants_of = _TABLE.variants_of
+url = _TABLE.url
+index_of = _TABLE.index_of
+lookup = _TABLE.lookup
+complete = _TABLE.complete
+resolve = _TABLE.resolve
+match = _TABLE.match
+match_all = _TABLE.match_all
+
+def __getattr__(name: str):
+    # KEYS, VARIANT_INDEX, STATIC_QA_LIST, URLS, ... built on first access
+    return _TABLE.module_attribute(name)
+"""
 
-    # 3) Auto-discovered sports (key = sport label e.g. "Rugby")
-    sport_map = discover_sports(records, exclude_prep=exclude_prep, prefer_domain=prefer_domain)
+def esc(s: str) -> str:
+    # Escape double quotes in strings
+    return s.replace('"', '\\"')
 
-    # Header
-    out = []
-    out.append(HEADER_TEMPLATE.format(
-        school=school,
-        site_root=site_root.rstrip("/"),
-        page_links_block=make_page_links_block(page_links)
-    ))
+_MD_BOLD_RX = re.compile(r"\*\*([^*]+)\*\*|__([^_]+)__")
+_MD_LINK_RX = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
 
-    out.append("\nSTATIC_QA_LIST = [\n")
+def markdown_to_text(s: str) -> str:
+    """
+    Plain-text rendering of the little Markdown hand-written answers use
+    (**bold**, [label](url)); the widget shows answers via textContent.
+    """
+    s = _MD_BOLD_RX.sub(lambda m: m.group(1) or m.group(2), s)
+    return _MD_LINK_RX.sub(r"\1 (\2)", s)
 
-    # Curated block (uses PAGE_LINKS via L("key"))
-    for key, info in curated:
-        out.append(make_item_block(
-            key=key,
-            url_key_or_url=key,   # uses PAGE_LINKS via L()
-            answer=info["answer"],
-            label=info["label"],
-            variants=info["variants"],
-            direct_url=False
-        ))
-        out.append("\n")
+def make_column_block(name: str, annotation: str, values: Iterable[str]) -> str:
+    """
+    One parallel column, e.g. URLS: Tuple[str, ...] = (...). values are
+    already-rendered Python literals, one per entry.
+    """
+    lines = [f"{name}: {annotation} = ("]
+    lines.extend(f"    {v}," for v in values)
+    lines.append(")\n")
+    return "\n".join(lines)
+
+QAItem = Tuple[str, str, str, str, Sequence[str]]  # (key, answer, url, label, variants)
+
+def iter_static_items(
+    school: str,
+    site_root: str,
+    page_links: Dict[str, str],
+    policy_map: Dict[str, str],
+    sport_map: Dict[str, str]
+) -> Iterator[QAItem]:
+    """Yield every static QA entry in output order: curated, policies, sports."""
+    # Curated block: URLs resolved from the core page links, as L(key) would at import
+    fallback = site_root.rstrip("/")
+    for key, info in core_static_items(school):
+        yield key, info["answer"], page_links.get(key, fallback), info["label"], info["variants"]
 
     # Auto policies block (direct URLs)
     # We generate safe variants from the label: base words + 'policy'
@@ -427,17 +667,7 @@ def render_static_qa(
             base_lower.replace("policy", "").strip(),
             "policy " + base_lower.replace(" policy", "").strip(),
         ]))
-        answer = f"Read the {label}."
-        key = f"policy::{label.lower()}"
-        out.append(make_item_block(
-            key=key,
-            url_key_or_url=url,   # direct URL
-            answer=answer,
-            label=label,
-            variants=variants,
-            direct_url=True
-        ))
-        out.append("\n")
+        yield f"policy::{label.lower()}", ANSWER_TEMPLATES[0].format(label=label), url, label, variants
 
     # Auto sports block (direct URLs)
     for sport_label, url in sorted(sport_map.items()):
@@ -448,20 +678,176 @@ def render_static_qa(
             f"boys {base}", f"girls {base}",
             f"{base} at {school.lower()}",
         ]))
-        answer = f"Find information about {sport_label} at {school}."
-        key = f"sport::{base}"
-        out.append(make_item_block(
-            key=key,
-            url_key_or_url=url,   # direct URL
-            answer=answer,
-            label=sport_label,
-            variants=variants,
-            direct_url=True
-        ))
-        out.append("\n")
-
-    out.append("]\n")
-    return "".join(out)
+        yield f"sport::{base}", ANSWER_TEMPLATES[1].format(label=sport_label, school=school), url, sport_label, variants
+
+def make_answer_text_block(rows: Iterable[QAItem]) -> str:
+    """ANSWER_TEXT: key -> pre-rendered plain text, only for answers containing Markdown."""
+    lines = [
+        "",
+        "# Answers containing Markdown, rendered to plain text once here rather than",
+        "# on every reply. Look up by key; any other answer is already plain text.",
+        "ANSWER_TEXT: Dict[str, str] = {",
+    ]
+    for key, answer, _, _, _ in rows:
+        text = markdown_to_text(answer)
+        if text != answer:
+            lines.append(f'    "{esc(key)}": "{esc(text)}",')
+    lines.append("}\n")
+    return "\n".join(lines)
+
+def entry_columns(
+    rows: Sequence[QAItem],
+    templates: Sequence[str],
+    url_prefixes: Sequence[str],
+    whole_urls: Iterable[str]
+) -> Dict[str, tuple]:
+    """
+    The parallel columns a config holds (static_qa_runtime.COLUMN_NAMES) for
+    rows: answers matching templates become the template's index, URLs become
+    a prefix id and suffix (see split_url) and variants are packed.
+    """
+    keys, answers, urls, labels, variants = zip(*rows) if rows else ((),) * 5
+    whole_urls = set(whole_urls)
+    url_prefix_ids, url_suffixes = zip(*(split_url(u, url_prefixes, whole_urls) for u in urls)) if rows else ((), ())
+    variants_blob, variant_offsets = pack_variants(variants)
+    return {
+        "KEYS": keys,
+        "ANSWERS": compact_answers(answers, labels, templates),
+        "URL_PREFIX_IDS": url_prefix_ids,
+        "URL_SUFFIXES": url_suffixes,
+        "LABELS": labels,
+        "VARIANTS_BLOB": variants_blob,
+        "VARIANT_OFFSETS": variant_offsets,
+    }
+
+def write_columns(out: TextIO, prefix: str, columns: Dict[str, tuple]) -> None:
+    """
+    Write entry_columns' columns as Python literals, names prefixed by prefix.
+    Every value is a literal (no names, no +) so each column compiles to a
+    single tuple constant that the .pyc unmarshals in one go, rather than a
+    BUILD_TUPLE run on every import. A URL literal equal to one of the URL
+    constants above is merged with it by the compiler, so nothing is copied.
+    """
+    out.write(make_column_block(prefix + "KEYS", "Tuple[str, ...]", (f'"{esc(k)}"' for k in columns["KEYS"])))
+    out.write(make_column_block(prefix + "ANSWERS", "Tuple[Union[str, int], ...]", (
+        str(a) if isinstance(a, int) else f'"{esc(a)}"' for a in columns["ANSWERS"]
+    )))
+    out.write(make_column_block(prefix + "URL_PREFIX_IDS", "Tuple[int, ...]", map(str, columns["URL_PREFIX_IDS"])))
+    out.write(make_column_block(prefix + "URL_SUFFIXES", "Tuple[str, ...]", (f'"{esc(u)}"' for u in columns["URL_SUFFIXES"])))
+    out.write(make_column_block(prefix + "LABELS", "Tuple[str, ...]", (f'"{esc(l)}"' for l in columns["LABELS"])))
+
+    # Variants of every entry packed into one string, each terminated by \0,
+    # with entry i's run between offsets i and i + 1, instead of one list per entry.
+    blob, offsets = columns["VARIANTS_BLOB"], columns["VARIANT_OFFSETS"]
+    out.write(f"{prefix}VARIANTS_BLOB: str = (\n")
+    for start, end in zip(offsets, offsets[1:]):
+        out.write('    "' + esc(blob[start:end]).replace("\0", "\\x00") + '"\n')
+    out.write(")\n")
+    out.write(make_column_block(prefix + "VARIANT_OFFSETS", "Tuple[int, ...]", map(str, offsets)))
+
+def pack_variants(variants: Sequence[Sequence[str]]) -> Tuple[str, Tuple[int, ...]]:
+    """(blob, offsets) for per-entry variant lists, len(offsets) == len(variants) + 1; see write_columns."""
+    parts, offsets, pos = [], [0], 0
+    for vs in variants:
+        chunk = "".join(v + "\0" for v in vs)
+        parts.append(chunk)
+        pos += len(chunk)
+        offsets.append(pos)
+    return "".join(parts), tuple(offsets)
+
+def write_static_qa(
+    out: TextIO,
+    policies_out: TextIO,
+    school: str,
+    site_root: str,
+    page_links: Dict[str, str],
+    items: Iterable[QAItem],
+    config_module: str = "static_qa_config"
+) -> Dict[str, tuple]:
+    """
+    Write the config module config_module (to out) and its policy shard,
+    policies_module_name(config_module) (to policies_out), for the given
+    entries. Entries are laid out as parallel columns (see entry_columns)
+    indexed by position, so a scan over one field touches only that column. Policy entries go to the second module; the
+    config holds the rest as CORE_* columns. Returns the policy columns (for
+    write_policies_blob).
+    """
+    core: List[QAItem] = []
+    policies: List[QAItem] = []
+    for key, answer, url, label, variants in items:
+        row = (key, answer, url, label, normalise_variants(variants))
+        (policies if key.startswith(POLICY_PREFIX) else core).append(row)
+
+    url_exprs, url_constants = hoist_urls(list(page_links.values()) + [row[2] for row in core])
+    whole_urls = set(url_constants.values())
+    url_prefixes = url_prefix_table((row[2] for row in core + policies), whole_urls)
+    templates = answer_templates(school)
+    core_columns = entry_columns(core, templates, url_prefixes, whole_urls)
+    policy_columns = entry_columns(policies, templates, url_prefixes, whole_urls)
+
+    out.write(HEADER_TEMPLATE.format(
+        school=school,
+        site_root=site_root.rstrip("/"),
+        url_constants_block=make_url_constants_block(url_constants),
+        page_links_block=make_page_links_block(page_links, url_exprs)
+    ))
+    out.write(f'\nLANGUAGE: str = "{LANGUAGE}"\n\n')
+    out.write('# Answers for entries whose ANSWERS slot is an index here, filled with their label\n')
+    out.write(make_column_block("ANSWER_TEMPLATES", "Tuple[str, ...]", (f'"{esc(t)}"' for t in templates)) + "\n")
+    out.write("# Entry i's URL is URL_PREFIXES[URL_PREFIX_IDS[i]] + URL_SUFFIXES[i], so the\n")
+    out.write("# directory most policy PDFs share is stored once; id 0 keeps the whole URL\n")
+    out.write(make_column_block("URL_PREFIXES", "Tuple[str, ...]", (f'"{esc(p)}"' for p in url_prefixes)) + "\n")
+    write_columns(out, "CORE_", core_columns)
+    out.write(make_answer_text_block(core + policies))
+    out.write("\n# (key prefix, module) for each shard appended after the core columns, in order.\n")
+    out.write(f'_SHARDS = (("{POLICY_PREFIX}", "{policies_module_name(config_module)}"),)\n')
+    out.write(FOOTER_TEMPLATE)
+
+    policies_out.write(POLICIES_HEADER_TEMPLATE.format(school=school, config_module=config_module))
+    write_columns(policies_out, "", policy_columns)
+    return policy_columns
+
+def write_policies_blob(blob_path: str, source_path: str, columns: Dict[str, tuple]) -> None:
+    """
+    Pickle the policy columns next to their module, tagged with a hash of the
+    module source. static_qa_config loads this instead of compiling the module
+    for as long as the hash still matches, so a hand edit to the .py wins.
+    Hashing the source and unpickling take ~0.06 ms together; an mmap'd
+    msgpack/FlatBuffer blob would save little, and the first lookup decodes
+    every entry into VARIANT_INDEX anyway.
+    """
+    with open(source_path, "rb") as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    with open(blob_path, "wb") as f:
+        pickle.dump({"source_hash": digest, "columns": columns}, f, protocol=5)
+
+def render_static_qa(
+    school: str,
+    site_root: str,
+    url_mapping: Dict[str, str],
+    records: Iterable[dict],
+    exclude_prep: bool,
+    prefer_domain: str,
+    out: TextIO,
+    policies_out: TextIO,
+    config_module: str = "static_qa_config"
+) -> Dict[str, tuple]:
+    """
+    Stream the generated config module's source into `out` (and the
+    policy entries into `policies_out`) block by block.
+    """
+
+    # 1) Core page links (curated items are added in iter_static_items)
+    page_links = core_page_links(url_mapping, site_root, school)
+
+    # 2) Auto-discovered policies (key = clean label e.g. "First Aid Policy")
+    # 3) Auto-discovered sports (key = sport label e.g. "Rugby")
+    # Both come from a single sweep over the records.
+    policy_map, sport_map = discover_all(records, exclude_prep=exclude_prep, prefer_domain=prefer_domain)
+
+    return write_static_qa(out, policies_out, school, site_root, page_links,
+                    iter_static_items(school, site_root, page_links, policy_map, sport_map),
+                    config_module)
 
 # -----------------------
 # CLI
@@ -479,21 +865,45 @@ def main():
     args = ap.parse_args()
 
     url_mapping = import_url_mapping(args.mapping)
-    records = load_metadata(args.metadata)
-
-    text = render_static_qa(
-        school=args.school,
-        site_root=args.site_root,
-        url_mapping=url_mapping,
-        records=records,
-        exclude_prep=args.exclude_prep,
-        prefer_domain=(args.prefer_domain or "")
-    )
-
-    with open(args.out, "w", encoding="utf-8") as f:
-        f.write(text)
-
-    print(f"✅ Wrote {args.out} for {args.school}")
+    # Generator: records are consumed once by the single discovery sweep
+    records = iter_metadata(args.metadata)
+
+    # The lazily imported policy module sits next to the config it belongs to,
+    # named after it so another school's config in the same directory has its own
+    config_module = os.path.splitext(os.path.basename(args.out))[0]
+    policies_path = os.path.join(os.path.dirname(args.out), policies_module_name(args.out) + ".py")
+    blob_path = os.path.splitext(policies_path)[0] + ".pkl"
+    outputs = (args.out, policies_path, blob_path)
+
+    # records is lazy, so a missing or corrupt metadata.pkl only shows up
+    # mid-render. Write everything to .tmp files first and move them into
+    # place once all three are complete; a failed run leaves the old files.
+    try:
+        with open(args.out + ".tmp", "w", encoding="utf-8") as f, \
+                open(policies_path + ".tmp", "w", encoding="utf-8") as pf:
+            policy_columns = render_static_qa(
+                school=args.school,
+                site_root=args.site_root,
+                url_mapping=url_mapping,
+                records=records,
+                exclude_prep=args.exclude_prep,
+                prefer_domain=(args.prefer_domain or ""),
+                out=f,
+                policies_out=pf,
+                config_module=config_module
+            )
+
+        # Written after the module is closed so its hash covers the final source
+        write_policies_blob(blob_path + ".tmp", policies_path + ".tmp", policy_columns)
+    except BaseException:
+        for path in outputs:
+            if os.path.exists(path + ".tmp"):
+                os.remove(path + ".tmp")
+        raise
+    for path in outputs:
+        os.replace(path + ".tmp", path)
+
+    print(f"✅ Wrote {args.out} and {policies_path} for {args.school}")
 
 if __name__ == "__main__":
     main()
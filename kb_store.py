@@ -0,0 +1,45 @@
+"""
+Readers for the knowledge base files written by rebuild_kb_chunks.py, shared
+by app.py, test_similarity.py and the rebuilder itself.
+"""
+
+import os
+import pickle
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+# First four bytes of every zstd frame
+ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+def load_pickle(path: str):
+    """pickle.load that also accepts the zstd-compressed files from rebuild_kb_chunks.py"""
+    with open(path, "rb") as f:
+        if f.read(4) == ZSTD_MAGIC:
+            import zstandard
+            f.seek(0)
+            return pickle.load(zstandard.ZstdDecompressor().stream_reader(f))
+        f.seek(0)
+        return pickle.load(f)
+
+def load_kb(base: str) -> Tuple[List[Dict], np.ndarray]:
+    """
+    (chunks, float32 (N, dim) embedding matrix) for the KB at base, e.g.
+    "kb_chunks/kb_chunks".
+
+    Reads <base>.meta.pkl + <base>.vecs.npy as written by rebuild_kb_chunks.py:
+    float32 vectors are memory-mapped as-is, float16/int8 ones are widened
+    once (int8 rows times their scale). Falls back to <base>.pkl, a list of
+    chunk dicts each carrying its own "embedding".
+    """
+    if os.path.exists(base + ".meta.pkl"):
+        meta = load_pickle(base + ".meta.pkl")
+        embeddings = np.load(base + ".vecs.npy", mmap_mode="r")
+        if embeddings.dtype != np.float32:
+            embeddings = embeddings.astype(np.float32)
+        if "embedding_scales" in meta:
+            embeddings = embeddings * np.asarray(meta["embedding_scales"], dtype=np.float32)[:, None]
+        return meta["chunks"], embeddings
+
+    chunks = load_pickle(base + ".pkl")
+    return chunks, np.array([chunk["embedding"] for chunk in chunks], dtype=np.float32)
@@ -14,6 +14,14 @@ from dotenv import load_dotenv
 from openai import OpenAI
 import logging
 
+try:
+    import orjson  # type: ignore
+    _json_loads = orjson.loads
+    _JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    _JSONDecodeError = json.JSONDecodeError
+
 # Setup
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -41,19 +49,18 @@ def rebuild_from_jsonl():
     
     logger.info(f"Loading chunks from: {jsonl_file}")
     
-    # Load chunks from JSONL
+    # Load chunks from JSONL (read once as bytes, split, then parse each line)
     chunks = []
-    with open(jsonl_file, 'r', encoding='utf-8') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                chunk = json.loads(line)
-                chunks.append(chunk)
-            except json.JSONDecodeError as e:
-                logger.warning(f"Failed to parse line {line_num}: {e}")
-                continue
+    with open(jsonl_file, 'rb') as f:
+        lines = f.read().splitlines()
+    for line_num, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        try:
+            chunks.append(_json_loads(line))
+        except _JSONDecodeError as e:
+            logger.warning(f"Failed to parse line {line_num}: {e}")
+            continue
     
     logger.info(f"Loaded {len(chunks)} chunks from JSONL")
     
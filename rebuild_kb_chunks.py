@@ -5,29 +5,273 @@ Regenerates embeddings for existing metadata with improved efficiency and reliab
 """
 
 import os
+import re
+import asyncio
+import hashlib
 import pickle
-import time
 import json
+import sqlite3
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Iterator, Optional, Tuple
 import numpy as np
+import tiktoken
 from dotenv import load_dotenv
-from openai import OpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import openai
+from openai import AsyncOpenAI
 import logging
 
+from kb_store import load_pickle
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson  # type: ignore
+    
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
 # Setup
 load_dotenv()
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+_DURATION_RX = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+def parse_duration(value: Optional[str]) -> Optional[float]:
+    """Parse OpenAI rate-limit durations such as '1s', '6m0s', '20ms' or '30' into seconds"""
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    parts = _DURATION_RX.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+# Transient failures worth retrying; anything else (400, 401, 403, 404, ...) fails at once
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+def retry_delay(error: Exception, attempt: int) -> float:
+    """Seconds to wait before the next attempt: retry-after on 429s, else exponential 2-10s"""
+    if isinstance(error, openai.RateLimitError):
+        retry_after = parse_duration(error.response.headers.get("retry-after"))
+        if retry_after is not None:
+            return retry_after
+    return min(10.0, 2.0 ** (attempt + 1))
+
+class EmbeddingCheckpoint:
+    """
+    On-disk store of finished embeddings, written batch by batch.
+    
+    Vectors go into a float32 .npy memmap with one row per metadata index, and
+    each finished index is appended to a JSONL log, with the model and the
+    row's text key, after its row is written. A rebuild that crashes can
+    resume by re-opening both files and skipping the logged indices; rows
+    logged for another model or another text (metadata re-crawled since) are
+    embedded again. RSS stays flat because vectors are not kept in RAM.
+    """
+    
+    def __init__(self, base_path: str, row_keys: List[Optional[bytes]], model: str):
+        self.vectors_file = base_path + ".partial.npy"
+        self.log_file = base_path + ".partial.jsonl"
+        self.row_keys = row_keys
+        self.n_rows = len(row_keys)
+        self.model = model
+        self.vectors: Optional[np.ndarray] = None
+        self.done = set()
+        
+        if os.path.exists(self.vectors_file) and os.path.exists(self.log_file):
+            vectors = np.load(self.vectors_file, mmap_mode="r+")
+            if vectors.shape[0] == self.n_rows:
+                self._resume(vectors)
+            else:
+                logger.warning(f"Ignoring checkpoint {self.vectors_file}: built for {vectors.shape[0]} chunks, not {self.n_rows}")
+        
+        if self.vectors is None:
+            self.remove()
+        
+        os.makedirs(os.path.dirname(self.log_file) or ".", exist_ok=True)
+        self._log = open(self.log_file, "a", encoding="utf-8")
+    
+    def _resume(self, vectors: np.ndarray):
+        """Keep the logged rows that still match this model and metadata, and drop the rest from the log"""
+        kept, stale = [], 0
+        with open(self.log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                idx = entry["idx"]
+                key = self.row_keys[idx] if 0 <= idx < self.n_rows else None
+                if key is None or entry.get("model") != self.model or entry.get("key") != key.hex():
+                    stale += 1
+                    continue
+                self.done.add(idx)
+                kept.append(line)
+        if stale:
+            logger.warning(f"Checkpoint {self.log_file}: re-embedding {stale} rows logged for another model or text")
+        if not self.done:
+            # Nothing reusable; start over (the vector width may differ for a new model)
+            return
+        if stale:
+            with open(self.log_file, "w", encoding="utf-8") as f:
+                f.writelines(kept)
+        self.vectors = vectors
+    
+    def write(self, indices: List[int], block: np.ndarray):
+        """Persist embeddings for the given metadata indices"""
+        if self.vectors is None:
+            self.vectors = np.lib.format.open_memmap(
+                self.vectors_file, mode="w+", dtype=np.float32, shape=(self.n_rows, block.shape[1])
+            )
+        self.vectors[indices] = block
+        self.vectors.flush()
+        self._log.write("".join(
+            json.dumps({"idx": i, "model": self.model, "key": self.row_keys[i].hex()}) + "\n" for i in indices
+        ))
+        self._log.flush()
+        self.done.update(indices)
+    
+    def matrix(self, indices: List[int]) -> np.ndarray:
+        """Load the rows for the given indices into memory"""
+        if self.vectors is None or not indices:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.asarray(self.vectors[indices], dtype=np.float32)
+    
+    def close(self):
+        self._log.close()
+        self.vectors = None
+    
+    def remove(self):
+        """Delete the checkpoint files (after the final output is saved)"""
+        for path in (self.vectors_file, self.log_file):
+            if os.path.exists(path):
+                os.remove(path)
+
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+# USD per input token; the Batch API bills half of this
+EMBEDDING_PRICES = {
+    "text-embedding-3-small": 0.02e-6,
+    "text-embedding-3-large": 0.13e-6,
+    "text-embedding-ada-002": 0.10e-6,
+}
+
+# Per-job limits of the OpenAI Batch API: requests, and size of the input file
+BATCH_API_MAX_REQUESTS = 50_000
+BATCH_API_MAX_BYTES = 200 * 1024 * 1024
+
+# Metadata fields that may hold a chunk's text, in priority order
+TEXT_FIELDS = ("text", "chunk", "content")
+
+def chunk_text(chunk: Dict) -> Optional[str]:
+    """A chunk's stripped text from the first non-empty TEXT_FIELDS entry, or None"""
+    text = next((chunk[field] for field in TEXT_FIELDS if chunk.get(field)), None)
+    text = text.strip() if text else None
+    return text or None
+
+# text-embedding-3-* reject inputs over 8191 tokens; longer texts are split
+# into pieces of at most this many tokens, leaving headroom for the joins
+MAX_INPUT_TOKENS = 8000
+_PARAGRAPH_RX = re.compile(r"\n\s*\n")
+_SENTENCE_RX = re.compile(r"(?<=[.!?])\s+")
+
+def mean_pool(vectors) -> np.ndarray:
+    """Unit-length mean of the embeddings of a split text's pieces"""
+    mean = np.asarray(vectors, dtype=np.float32).mean(axis=0)
+    return mean / max(float(np.linalg.norm(mean)), 1e-12)
+
+def quantize_embeddings(matrix: np.ndarray, storage_dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Unit-normalise rows and convert them to the storage dtype.
+    
+    Returns (vectors, scales); scales is only set for int8, where row i is
+    recovered as vectors[i] * scales[i].
+    """
+    vecs = np.asarray(matrix, dtype=np.float32)
+    if vecs.size == 0:
+        return vecs.astype(storage_dtype), (np.empty(0, dtype=np.float32) if storage_dtype == "int8" else None)
+    norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+    vecs = vecs / np.maximum(norms, 1e-12)
+    if storage_dtype != "int8":
+        return vecs.astype(storage_dtype), None
+    scales = np.abs(vecs).max(axis=1) / 127
+    scales[scales == 0] = 1.0
+    q8 = np.rint(vecs / scales[:, None]).astype(np.int8)
+    return q8, scales.astype(np.float32)
+
+class EmbeddingCache:
+    """
+    Persistent content-addressed store of embeddings, shared across rebuilds.
+    
+    Keys are blake2b digests of model + text, so an incremental rebuild only
+    sends new or edited chunks to the API and switching models never reuses
+    stale vectors.
+    """
+    
+    # Stay under SQLite's default limit on bound parameters per statement
+    QUERY_CHUNK = 900
+    
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS cache (key BLOB PRIMARY KEY, vec BLOB)")
+    
+    def get_many(self, keys: List[bytes]) -> Dict[bytes, np.ndarray]:
+        """Look up cached vectors; keys that are not cached are left out"""
+        found = {}
+        for start in range(0, len(keys), self.QUERY_CHUNK):
+            part = keys[start:start + self.QUERY_CHUNK]
+            rows = self.db.execute(
+                f"SELECT key, vec FROM cache WHERE key IN ({','.join('?' * len(part))})", part
+            )
+            for key, vec in rows:
+                found[key] = np.frombuffer(vec, dtype=np.float32)
+        return found
+    
+    def put_many(self, keys: List[bytes], block: np.ndarray):
+        """Store one vector per key"""
+        block = np.asarray(block, dtype=np.float32)
+        with self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO cache (key, vec) VALUES (?, ?)",
+                ((key, row.tobytes()) for key, row in zip(keys, block))
+            )
+    
+    def close(self):
+        self.db.close()
+
 class KBChunksRebuilder:
     def __init__(self, 
                  metadata_file: str = "metadata.pkl",
                  output_file: str = "kb_chunks/kb_chunks.pkl",
                  embedding_model: str = "text-embedding-3-small",
-                 batch_size: int = 20,
-                 max_retries: int = 3):
+                 batch_size: int = 2048,
+                 max_tokens_per_batch: int = 250_000,
+                 max_retries: int = 3,
+                 max_concurrency: int = 8,
+                 use_batch_api: bool = False,
+                 batch_poll_interval: float = 30.0,
+                 emit_json: bool = False,
+                 cache_file: Optional[str] = ".embeddings_cache.sqlite",
+                 storage_dtype: str = "float16",
+                 compress_level: int = 3,
+                 failed_file: str = "failed_chunks.ndjson"):
         """
         Initialize the rebuilder with configuration
         
@@ -35,20 +279,58 @@ class KBChunksRebuilder:
             metadata_file: Path to metadata pickle file
             output_file: Path to output kb_chunks pickle file
             embedding_model: OpenAI embedding model to use
-            batch_size: Number of texts to embed in one API call
-            max_retries: Maximum retries for failed embeddings
+            batch_size: Maximum number of texts to embed in one API call
+            max_tokens_per_batch: Maximum total input tokens in one API call
+            max_retries: Attempts per embedding request before giving up on transient errors
+            max_concurrency: Maximum embedding requests in flight at once
+            use_batch_api: Submit everything as OpenAI Batch API jobs instead
+                of live requests (half price, higher limits, up to 24h turnaround)
+            batch_poll_interval: Seconds between Batch API status checks
+            emit_json: Also write a JSON copy of the chunk metadata for inspection
+            cache_file: SQLite embedding cache reused across rebuilds (None disables it)
+            storage_dtype: Precision of the saved, unit-normalised vectors:
+                "float32", "float16" (half the size) or "int8" (a quarter, plus per-row scales)
+            compress_level: zstd level for the output pickle (0 writes it uncompressed)
+            failed_file: NDJSON log of chunks that could not be embedded, one line per chunk
         """
         self.metadata_file = metadata_file
         self.output_file = output_file
         self.embedding_model = embedding_model
         self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
         self.max_retries = max_retries
+        self.max_concurrency = max_concurrency
+        self.use_batch_api = use_batch_api
+        self.batch_poll_interval = batch_poll_interval
+        self.emit_json = emit_json
+        self.cache_file = cache_file
+        if storage_dtype not in STORAGE_DTYPES:
+            raise ValueError(f"storage_dtype must be one of {', '.join(STORAGE_DTYPES)}, got {storage_dtype!r}")
+        self.storage_dtype = storage_dtype
+        self.compress_level = compress_level
+        self.failed_file = failed_file
+        
+        # (N, dim) float32 matrix of all embeddings, row i ↔ kb_chunks[i]
+        self.embedding_matrix: Optional[np.ndarray] = None
+        # Incremental on-disk store used by the live (non-Batch API) path
+        self.checkpoint: Optional[EmbeddingCheckpoint] = None
+        # Tokenizer for the embedding model, loaded on first use
+        self.encoding = None
+        # Chunks sharing identical text: representative index → all its indices
+        self.text_groups: Dict[int, List[int]] = {}
+        # Cache key of each representative chunk's text
+        self.text_keys: Dict[int, bytes] = {}
+        self.cache: Optional[EmbeddingCache] = None
+        # Position in the metadata file of each chunk being processed, for failure reports
+        self.chunk_ids: List[int] = []
+        self.failed_log = None
         
         # Initialize OpenAI client
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
-        self.client = OpenAI(api_key=api_key)
+        # generate_embeddings_batch owns retries; the SDK's own would multiply them
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0)
         
         # Statistics
         self.stats = {
@@ -56,7 +338,9 @@ class KBChunksRebuilder:
             "successful_embeddings": 0,
             "failed_embeddings": 0,
             "skipped_chunks": 0,
+            "cached_embeddings": 0,
             "api_calls": 0,
+            "total_tokens": 0,
             "start_time": None,
             "end_time": None
         }
@@ -72,136 +356,529 @@ class KBChunksRebuilder:
         logger.info(f"Loaded {len(metadata)} chunks from {self.metadata_file}")
         return metadata
     
-    def extract_text(self, chunk: Dict) -> str:
-        """Extract text from chunk, handling different field names"""
-        text = chunk.get("text") or chunk.get("chunk") or chunk.get("content")
-        if not text:
-            logger.warning(f"No text field found in chunk: {chunk.keys()}")
+    def text_key(self, text: str) -> bytes:
+        """Cache key for a text under the current embedding model"""
+        return hashlib.blake2b((self.embedding_model + "\x00" + text).encode("utf-8"), digest_size=16).digest()
+    
+    def count_tokens(self, texts: List[str]) -> List[int]:
+        """Token count per text using the embedding model's tokenizer"""
+        if self.encoding is None:
+            try:
+                self.encoding = tiktoken.encoding_for_model(self.embedding_model)
+            except KeyError:
+                self.encoding = tiktoken.get_encoding("cl100k_base")
+        return [len(tokens) for tokens in self.encoding.encode_ordinary_batch(texts)]
+    
+    def _prepare(self, metadata: List[Dict], skip=frozenset()) -> List[Tuple[int, str, int]]:
+        """
+        Resolve, strip and tokenize every chunk's text in one pass.
+        
+        Returns one (index, text, token_count) item per distinct text, and
+        records in text_groups/text_keys which chunks share each text. Chunks
+        in skip (already embedded) and chunks without text are left out.
+        """
+        first_with_text: Dict[bytes, int] = {}
+        self.text_groups = {}
+        self.text_keys = {}
+        indices, texts = [], []
+        empty = []
+        for i, chunk in enumerate(metadata):
+            if i in skip:
+                continue
+            text = chunk_text(chunk)
+            if not text:
+                empty.append(i)
+                continue
+            key = self.text_key(text)
+            first = first_with_text.get(key)
+            if first is not None:
+                self.text_groups[first].append(i)
+                continue
+            first_with_text[key] = i
+            self.text_groups[i] = [i]
+            self.text_keys[i] = key
+            indices.append(i)
+            texts.append(text)
+        
+        if empty:
+            self.stats["skipped_chunks"] += len(empty)
+            logger.warning(f"Skipping {len(empty)} chunks with no text content (first few: {empty[:10]})")
+        duplicates = sum(len(group) - 1 for group in self.text_groups.values())
+        if duplicates:
+            logger.info(f"Skipping {duplicates} duplicate texts; their embeddings are shared")
+        
+        return list(zip(indices, texts, self.count_tokens(texts)))
+    
+    def split_text(self, text: str, max_tokens: int = MAX_INPUT_TOKENS) -> List[str]:
+        """
+        Split an oversize text into pieces of at most max_tokens, breaking on
+        paragraphs, then sentences, and only cutting mid-sentence as a last resort.
+        """
+        pieces, current, current_tokens = [], [], 0
+        
+        def flush():
+            nonlocal current, current_tokens
+            if current:
+                pieces.append("\n\n".join(current))
+            current, current_tokens = [], 0
+        
+        segments = [segment for segment in _PARAGRAPH_RX.split(text) if segment.strip()]
+        segments.reverse()
+        while segments:
+            segment = segments.pop()
+            n_tokens = self.count_tokens([segment])[0]
+            if n_tokens > max_tokens:
+                sentences = [sentence for sentence in _SENTENCE_RX.split(segment) if sentence.strip()]
+                if len(sentences) > 1:
+                    segments.extend(reversed(sentences))
+                    continue
+                # One enormous sentence: cut it on token boundaries
+                flush()
+                tokens = self.encoding.encode_ordinary(segment)
+                pieces.extend(self.encoding.decode(tokens[i:i + max_tokens]) for i in range(0, len(tokens), max_tokens))
+                continue
+            # +1 per segment for the separator it is joined with
+            if current and current_tokens + n_tokens + 1 > max_tokens:
+                flush()
+            current.append(segment)
+            current_tokens += n_tokens + 1
+        flush()
+        return pieces
+    
+    def pack_batches(self, items: List[Tuple[int, str, int]]) -> Iterator[Tuple[List[int], List[str]]]:
+        """
+        Greedily pack (index, text, token_count) items into batches capped by
+        max_tokens_per_batch and batch_size, yielding each batch as soon as it
+        is full. Items are sorted by length first so each request carries
+        texts of similar size.
+        """
+        indices, texts, tokens = [], [], 0
+        for idx, text, n_tokens in sorted(items, key=lambda item: item[2]):
+            if texts and (tokens + n_tokens > self.max_tokens_per_batch or len(texts) >= self.batch_size):
+                yield indices, texts
+                indices, texts, tokens = [], [], 0
+            indices.append(idx)
+            texts.append(text)
+            tokens += n_tokens
+        if texts:
+            yield indices, texts
+    
+    async def respect_rate_limit(self, headers):
+        """Slow down when the request budget for the current window is nearly spent"""
+        try:
+            remaining = int(headers.get("x-ratelimit-remaining-requests"))
+        except (TypeError, ValueError):
+            return
+        reset = parse_duration(headers.get("x-ratelimit-reset-requests"))
+        if reset and remaining < self.max_concurrency:
+            # Spread what is left of the window across the remaining requests
+            delay = reset / max(remaining, 1)
+            logger.debug(f"Rate limit: {remaining} requests left, pausing {delay:.2f}s")
+            await asyncio.sleep(delay)
+    
+    async def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed a batch of texts, retrying rate limits, timeouts and 5xx errors up
+        to max_retries attempts. Bad requests and auth errors are raised at once.
+        """
+        attempts = max(1, self.max_retries)
+        for attempt in range(attempts):
+            try:
+                raw = await self.client.embeddings.with_raw_response.create(
+                    model=self.embedding_model,
+                    input=texts
+                )
+                self.stats["api_calls"] += 1
+                response = raw.parse()
+                if response.usage:
+                    self.stats["total_tokens"] += response.usage.prompt_tokens
+                await self.respect_rate_limit(raw.headers)
+                return [data.embedding for data in response.data]
+            except RETRYABLE_ERRORS as e:
+                if attempt + 1 == attempts:
+                    logger.error(f"Batch embedding failed after {attempts} attempts: {e}")
+                    e.attempts = attempts  # reported in the failed chunks log
+                    raise
+                delay = retry_delay(e, attempt)
+                logger.warning(f"Batch embedding failed ({type(e).__name__}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+            except Exception as e:
+                logger.error(f"Batch embedding failed: {e}")
+                e.attempts = attempt + 1
+                raise
+    
+    def log_failure(self, indices: List[int], text: str, error_type: str, error_msg: str, attempts: int = 1):
+        """Append one line per chunk that could not be embedded to the failed chunks log"""
+        if self.failed_log is None:
+            return
+        for idx in indices:
+            self.failed_log.write(_json_dumps({
+                "chunk_id": self.chunk_ids[idx] if self.chunk_ids else idx,
+                "text_preview": text[:200],
+                "error_type": error_type,
+                "error_msg": error_msg,
+                "attempt_count": attempts
+            }) + b"\n")
+        self.failed_log.flush()
+    
+    def group_of(self, idx: int) -> List[int]:
+        """All chunk indices whose text is identical to chunk idx"""
+        return self.text_groups.get(idx, [idx])
+    
+    def store_embeddings(self, checkpoint: EmbeddingCheckpoint, indices: List[int], embeddings,
+                         from_cache: bool = False) -> int:
+        """Write embeddings to the checkpoint, copying each one to every chunk sharing its text"""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if self.cache and not from_cache:
+            self.cache.put_many([self.text_keys[idx] for idx in indices], embeddings)
+        groups = [self.group_of(idx) for idx in indices]
+        rows = [i for group in groups for i in group]
+        checkpoint.write(rows, np.repeat(embeddings, [len(group) for group in groups], axis=0))
+        return len(rows)
+    
+    async def embed_batch(self, batch_id: int, batch_indices: List[int], batch_texts: List[str],
+                          checkpoint: EmbeddingCheckpoint, semaphore: asyncio.Semaphore) -> List[int]:
+        """
+        Embed one prepared batch straight into the checkpoint, falling back to
+        concurrent one-by-one calls if the batch fails. Returns the indices that failed.
+        """
+        try:
+            async with semaphore:
+                embeddings = await self.generate_embeddings_batch(batch_texts)
+            self.stats["successful_embeddings"] += self.store_embeddings(checkpoint, batch_indices, embeddings)
+            return []
+            
+        except Exception as e:
+            logger.error(f"Failed to process batch {batch_id}: {e}")
+            self.stats["failed_embeddings"] += sum(len(self.group_of(idx)) for idx in batch_indices)
+        
+        # Retry each text on its own, concurrently and under the same semaphore
+        async def embed_one(idx: int, text: str) -> Optional[int]:
+            try:
+                async with semaphore:
+                    embeddings = await self.generate_embeddings_batch([text])
+            except Exception as e2:
+                logger.error(f"Individual embedding also failed: {e2}")
+                self.log_failure(self.group_of(idx), text, type(e2).__name__, str(e2), getattr(e2, "attempts", 1))
+                return idx
+            stored = self.store_embeddings(checkpoint, [idx], embeddings)
+            self.stats["successful_embeddings"] += stored
+            self.stats["failed_embeddings"] -= stored
             return None
-        return text.strip()
+        
+        results = await asyncio.gather(*(embed_one(idx, text) for idx, text in zip(batch_indices, batch_texts)))
+        return [i for idx in results if idx is not None for i in self.group_of(idx)]
     
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    def generate_embeddings_batch(self, texts: List[str]) -> List[List[float]]:
-        """Generate embeddings for a batch of texts with retry logic"""
+    async def embed_split(self, idx: int, text: str, checkpoint: EmbeddingCheckpoint,
+                          semaphore: asyncio.Semaphore) -> List[int]:
+        """
+        Embed a text over the model's input limit as one request of pieces and
+        store the mean of their vectors. Returns the indices that failed.
+        """
+        pieces = self.split_text(text)
         try:
-            response = self.client.embeddings.create(
-                model=self.embedding_model,
-                input=texts
-            )
-            self.stats["api_calls"] += 1
-            return [data.embedding for data in response.data]
+            async with semaphore:
+                embeddings = await self.generate_embeddings_batch(pieces)
         except Exception as e:
-            logger.error(f"Batch embedding failed: {e}")
-            raise
+            logger.error(f"Failed to embed oversize chunk {idx} ({len(pieces)} pieces): {e}")
+            failed = self.group_of(idx)
+            self.log_failure(failed, text, type(e).__name__, str(e), getattr(e, "attempts", 1))
+            self.stats["failed_embeddings"] += len(failed)
+            return failed
+        self.stats["successful_embeddings"] += self.store_embeddings(checkpoint, [idx], mean_pool(embeddings)[None, :])
+        return []
     
-    def process_chunks(self, metadata: List[Dict]) -> List[Dict]:
-        """Process all chunks and add embeddings"""
-        kb_chunks = []
-        failed_chunks = []
+    async def process_chunks(self, metadata: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Process all chunks and add embeddings, running batches concurrently"""
+        row_keys = [self.text_key(text) if text else None for text in map(chunk_text, metadata)]
+        checkpoint = EmbeddingCheckpoint(os.path.splitext(self.output_file)[0], row_keys, self.embedding_model)
+        self.checkpoint = checkpoint
+        if checkpoint.done:
+            logger.info(f"Resuming from checkpoint: {len(checkpoint.done)} chunks already embedded")
+            self.stats["successful_embeddings"] += len(checkpoint.done)
         
-        # Process in batches
-        for i in range(0, len(metadata), self.batch_size):
-            batch_metadata = metadata[i:i + self.batch_size]
-            batch_texts = []
-            batch_indices = []
-            
-            # Prepare batch
-            for j, chunk in enumerate(batch_metadata):
-                text = self.extract_text(chunk)
-                if text:
-                    batch_texts.append(text)
-                    batch_indices.append(j)
-                else:
-                    self.stats["skipped_chunks"] += 1
-                    logger.warning(f"Skipping chunk {i+j}: No text content")
+        # Each distinct pending text once, already stripped and tokenized
+        pending = self._prepare(metadata, skip=checkpoint.done)
+        
+        # Texts embedded by an earlier rebuild come straight from the cache
+        if self.cache and pending:
+            cached = self.cache.get_many([self.text_keys[i] for i, _, _ in pending])
+            if cached:
+                hits = [i for i, _, _ in pending if self.text_keys[i] in cached]
+                stored = self.store_embeddings(
+                    checkpoint, hits, np.vstack([cached[self.text_keys[i]] for i in hits]), from_cache=True
+                )
+                self.stats["successful_embeddings"] += stored
+                self.stats["cached_embeddings"] += stored
+                logger.info(f"Reused {len(hits)} cached embeddings")
+                pending = [item for item in pending if self.text_keys[item[0]] not in cached]
+        
+        # Texts over the model's input limit would fail their whole batch; they
+        # are split and embedded on their own instead
+        oversize = [(i, text) for i, text, n_tokens in pending if n_tokens > MAX_INPUT_TOKENS]
+        if oversize:
+            logger.info(f"Splitting {len(oversize)} texts over {MAX_INPUT_TOKENS} tokens; their pieces are embedded and averaged")
+            pending = [item for item in pending if item[2] <= MAX_INPUT_TOKENS]
+        
+        failed: List[int] = []
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        # Bounded so batches are packed just ahead of the workers, not all up front
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2 * self.max_concurrency)
+        
+        def report_progress():
+            done = self.stats["successful_embeddings"]
+            progress = done / len(metadata) * 100
+            logger.info(f"Progress: {done}/{len(metadata)} chunks ({progress:.1f}%)")
+        
+        async def produce():
+            for idx, text in oversize:
+                await queue.put((self.embed_split, (idx, text)))
+            n_batches = 0
+            for batch_id, (batch_indices, batch_texts) in enumerate(self.pack_batches(pending)):
+                await queue.put((self.embed_batch, (batch_id, batch_indices, batch_texts)))
+                n_batches += 1
+            logger.info(f"Packed {len(pending)} unique texts into {n_batches} batches")
+            # One stop marker per worker
+            for _ in range(self.max_concurrency):
+                await queue.put(None)
+        
+        async def work():
+            while (job := await queue.get()) is not None:
+                embed, args = job
+                failed.extend(await embed(*args, checkpoint, semaphore))
+                report_progress()
+        
+        # max_concurrency workers keep requests in flight back to back; the
+        # semaphore also covers their one-by-one fallbacks, and
+        # generate_embeddings_batch backs off on 429s
+        try:
+            await asyncio.gather(produce(), *(work() for _ in range(self.max_concurrency)))
             
-            if not batch_texts:
+            # Assemble output in input order from the checkpoint
+            done = sorted(checkpoint.done)
+            self.embedding_matrix = checkpoint.matrix(done)
+        finally:
+            checkpoint.close()
+        
+        # metadata is not used after the rebuild, so output the same dicts rather than copies
+        kb_chunks = [metadata[i] for i in done]
+        failed_chunks = [metadata[i] for i in sorted(failed)]
+        return kb_chunks, failed_chunks
+    
+    async def process_chunks_batch_api(self, metadata: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Embed all chunks through OpenAI Batch API jobs"""
+        # Build the batch input: one /v1/embeddings request per distinct text
+        items = self._prepare(metadata)
+        keys = {i: self.text_keys[first] for first, group in self.text_groups.items() for i in group}
+        indices = sorted(keys)
+        
+        # Only texts missing from the cache go into the job
+        embeddings = self.cache.get_many(list(self.text_keys.values())) if self.cache else {}
+        self.stats["cached_embeddings"] += sum(1 for key in keys.values() if key in embeddings)
+        requests = []
+        for i, text, n_tokens in items:
+            if self.text_keys[i] in embeddings:
                 continue
-            
-            # Generate embeddings for batch
-            try:
-                embeddings = self.generate_embeddings_batch(batch_texts)
-                
-                # Add embeddings to chunks
-                for idx, embedding in zip(batch_indices, embeddings):
-                    chunk = batch_metadata[idx].copy()
-                    chunk["embedding"] = embedding
-                    kb_chunks.append(chunk)
-                    self.stats["successful_embeddings"] += 1
-                
-                # Progress update
-                progress = len(kb_chunks) / len(metadata) * 100
-                logger.info(f"Progress: {len(kb_chunks)}/{len(metadata)} chunks ({progress:.1f}%)")
-                
-                # Rate limiting
-                time.sleep(0.5)
-                
-            except Exception as e:
-                logger.error(f"Failed to process batch {i//self.batch_size}: {e}")
-                self.stats["failed_embeddings"] += len(batch_texts)
-                failed_chunks.extend(batch_metadata)
-                
-                # Try individual processing for failed batch
-                for j, text in enumerate(batch_texts):
-                    try:
-                        response = self.client.embeddings.create(
-                            model=self.embedding_model,
-                            input=text
-                        )
-                        chunk = batch_metadata[batch_indices[j]].copy()
-                        chunk["embedding"] = response.data[0].embedding
-                        kb_chunks.append(chunk)
-                        self.stats["successful_embeddings"] += 1
-                        self.stats["failed_embeddings"] -= 1
-                        time.sleep(1)  # Extra delay for individual calls
-                    except Exception as e2:
-                        logger.error(f"Individual embedding also failed: {e2}")
+            if n_tokens > MAX_INPUT_TOKENS:
+                # Send the pieces as one request; their vectors are averaged on the way back
+                text = self.split_text(text)
+            requests.append((i, _json_dumps({
+                "custom_id": str(i),
+                "method": "POST",
+                "url": "/v1/embeddings",
+                "body": {"model": self.embedding_model, "input": text}
+            })))
+        
+        # One job per BATCH_API_MAX_REQUESTS / BATCH_API_MAX_BYTES slice, all waited on together
+        jobs = list(self.split_batch_jobs(requests))
+        if len(jobs) > 1:
+            logger.info(f"Splitting {len(requests)} requests into {len(jobs)} batch jobs")
+        errors = {}
+        for job_errors in await asyncio.gather(*(self.run_batch_job(job, keys, embeddings) for job in jobs)):
+            errors.update(job_errors)
+        texts = {self.text_keys[i]: text for i, text, _ in items}
         
+        kb_chunks = []
+        vectors = []
+        failed_chunks = []
+        for idx in indices:
+            embedding = embeddings.get(keys[idx])
+            if embedding is None:
+                self.stats["failed_embeddings"] += 1
+                failed_chunks.append(metadata[idx])
+                self.log_failure([idx], texts[keys[idx]], "BatchRequestError", errors.get(keys[idx], "no result in batch output"))
+                continue
+            kb_chunks.append(metadata[idx])
+            vectors.append(embedding)
+            self.stats["successful_embeddings"] += 1
+        
+        self.embedding_matrix = self.build_embedding_matrix(vectors)
         return kb_chunks, failed_chunks
     
+    def split_batch_jobs(self, requests: List[Tuple[int, bytes]]) -> Iterator[List[Tuple[int, bytes]]]:
+        """Split (index, JSONL line) requests into jobs within the Batch API's per-job limits"""
+        job, size = [], 0
+        for request in requests:
+            n_bytes = len(request[1]) + 1
+            if job and (len(job) >= BATCH_API_MAX_REQUESTS or size + n_bytes > BATCH_API_MAX_BYTES):
+                yield job
+                job, size = [], 0
+            job.append(request)
+            size += n_bytes
+        if job:
+            yield job
+    
+    async def read_batch_file(self, file_id: str) -> List[Dict]:
+        """Parsed result lines of a Batch API output or error file"""
+        output = await self.client.files.content(file_id)
+        return [json.loads(line) for line in output.content.splitlines() if line.strip()]
+    
+    async def run_batch_job(self, requests: List[Tuple[int, bytes]], keys: Dict[int, bytes],
+                            embeddings: Dict[bytes, np.ndarray]) -> Dict[bytes, str]:
+        """
+        Submit a Batch API job, wait for it, and add its vectors to embeddings
+        (by cache key). Returns the error message of each failed request, by cache
+        key; if the job itself fails, every request in it is returned as failed.
+        """
+        payload = b"\n".join(line for _, line in requests) + b"\n"
+        input_file = await self.client.files.create(
+            file=("kb_chunks_embeddings.jsonl", payload),
+            purpose="batch"
+        )
+        batch = await self.client.batches.create(
+            input_file_id=input_file.id,
+            endpoint="/v1/embeddings",
+            completion_window="24h"
+        )
+        self.stats["api_calls"] += 1
+        logger.info(f"Submitted batch {batch.id} with {len(requests)} requests")
+        
+        # Poll until the job reaches a terminal state
+        while batch.status not in ("completed", "failed", "expired", "cancelled"):
+            await asyncio.sleep(self.batch_poll_interval)
+            batch = await self.client.batches.retrieve(batch.id)
+            counts = batch.request_counts
+            if counts:
+                logger.info(f"Batch {batch.id} {batch.status}: {counts.completed}/{counts.total} done, {counts.failed} failed")
+        
+        # Failed requests are reported in the error file, which may be all a
+        # failed or expired job has; requests missing from both files count as failed
+        if batch.status == "completed":
+            missing = "no result in batch output"
+        else:
+            missing = f"batch {batch.id} ended with status {batch.status}"
+            logger.error(f"Batch {batch.id} ended with status {batch.status}")
+        errors = {keys[i]: missing for i, _ in requests}
+        results = []
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if file_id:
+                results.extend(await self.read_batch_file(file_id))
+        
+        # Map custom_id → embedding, keyed by text hash so the cache can keep it
+        new_keys, new_vectors = [], []
+        for result in results:
+            response = result.get("response") or {}
+            if response.get("status_code") == 200:
+                key = keys[int(result["custom_id"])]
+                data = response["body"]["data"]
+                self.stats["total_tokens"] += response["body"].get("usage", {}).get("prompt_tokens", 0)
+                if len(data) == 1:
+                    embeddings[key] = np.asarray(data[0]["embedding"], dtype=np.float32)
+                else:
+                    embeddings[key] = mean_pool([item["embedding"] for item in data])
+                new_keys.append(key)
+                new_vectors.append(embeddings[key])
+                errors.pop(key, None)
+            else:
+                error = result.get('error') or response
+                logger.error(f"Batch request {result['custom_id']} failed: {error}")
+                errors[keys[int(result["custom_id"])]] = str(error)
+        
+        if self.cache and new_vectors:
+            self.cache.put_many(new_keys, np.vstack(new_vectors))
+        return errors
+    
+    def build_embedding_matrix(self, vectors: List[np.ndarray]) -> np.ndarray:
+        """Stack per-chunk embeddings into one contiguous (N, dim) float32 matrix"""
+        if not vectors:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack(vectors).astype(np.float32, copy=False)
+    
     def save_chunks(self, kb_chunks: List[Dict]):
-        """Save chunks to pickle file"""
+        """
+        Save the KB as two files next to output_file:
+        <base>.vecs.npy holds the (N, dim) embedding matrix, which readers can
+        np.load(mmap_mode="r"), and <base>.meta.pkl holds the chunk dicts
+        (plus int8 scales when used). Row i of the matrix belongs to chunk i.
+        """
+        base = os.path.splitext(self.output_file)[0]
+        meta_file = base + ".meta.pkl"
+        vecs_file = base + ".vecs.npy"
+        
         # Create directory if needed
         os.makedirs(os.path.dirname(self.output_file), exist_ok=True)
         
-        # Save pickle file
-        with open(self.output_file, "wb") as f:
-            pickle.dump(kb_chunks, f)
+        vectors, scales = quantize_embeddings(self.embedding_matrix, self.storage_dtype)
+        np.save(vecs_file, vectors, allow_pickle=False)
         
-        logger.info(f"Saved {len(kb_chunks)} chunks to {self.output_file}")
+        meta = {"chunks": kb_chunks}
+        if scales is not None:
+            meta["embedding_scales"] = scales
+        compress = self.compress_level > 0
+        if compress and zstandard is None:
+            logger.warning("zstandard not installed; saving uncompressed. Run: pip install zstandard")
+            compress = False
+        with open(meta_file, "wb") as f:
+            if compress:
+                # Stream through the compressor so the raw pickle is never held in memory
+                with zstandard.ZstdCompressor(level=self.compress_level).stream_writer(f, closefd=False) as writer:
+                    pickle.dump(meta, writer, protocol=5)
+            else:
+                pickle.dump(meta, f, protocol=5)
         
-        # Also save as JSON for inspection
-        json_file = self.output_file.replace('.pkl', '.json')
-        chunks_for_json = []
-        for chunk in kb_chunks:
-            chunk_copy = chunk.copy()
-            # Convert embedding to list for JSON serialization
-            if "embedding" in chunk_copy and isinstance(chunk_copy["embedding"], np.ndarray):
-                chunk_copy["embedding"] = chunk_copy["embedding"].tolist()
-            chunks_for_json.append(chunk_copy)
-        
-        with open(json_file, "w", encoding="utf-8") as f:
-            json.dump({
-                "metadata": {
-                    "total_chunks": len(chunks_for_json),
-                    "embedding_model": self.embedding_model,
-                    "created_at": datetime.now().isoformat()
-                },
-                "chunks": chunks_for_json
-            }, f, indent=2, ensure_ascii=False)
+        logger.info(
+            f"Saved {len(kb_chunks)} chunks to {meta_file}{' (zstd)' if compress else ''} "
+            f"and {self.storage_dtype} embeddings to {vecs_file} "
+            f"({(os.path.getsize(meta_file) + os.path.getsize(vecs_file)) / 1e6:.1f} MB)"
+        )
         
-        logger.info(f"Also saved JSON version to {json_file}")
-    
-    def save_failed_chunks(self, failed_chunks: List[Dict]):
-        """Save failed chunks for manual inspection"""
-        if not failed_chunks:
+        if not self.emit_json:
             return
         
-        failed_file = "failed_chunks.pkl"
-        with open(failed_file, "wb") as f:
-            pickle.dump(failed_chunks, f)
+        # Also save chunk metadata (no embeddings) as compact JSON for inspection,
+        # written one chunk at a time so the whole document is never built in memory
+        json_file = self.output_file.replace('.pkl', '.json')
+        header = _json_dumps({
+            "total_chunks": len(kb_chunks),
+            "embedding_model": self.embedding_model,
+            "embedding_dim": int(self.embedding_matrix.shape[1]) if self.embedding_matrix is not None else 0,
+            "embedding_dtype": self.storage_dtype,
+            "created_at": datetime.now().isoformat()
+        })
+        with open(json_file, "wb") as f:
+            f.write(b'{"metadata":' + header + b',"chunks":[')
+            for n, chunk in enumerate(kb_chunks):
+                if n:
+                    f.write(b",")
+                f.write(_json_dumps(chunk))
+            f.write(b"]}")
         
-        logger.warning(f"Saved {len(failed_chunks)} failed chunks to {failed_file}")
+        logger.info(f"Also saved JSON version to {json_file}")
+    
+    def load_output(self) -> Tuple[List[Dict], np.ndarray]:
+        """Read back a KB written by save_chunks as (chunks, float32 embedding matrix)"""
+        base = os.path.splitext(self.output_file)[0]
+        meta = load_pickle(base + ".meta.pkl")
+        vectors = np.load(base + ".vecs.npy").astype(np.float32)
+        if "embedding_scales" in meta:
+            vectors *= np.asarray(meta["embedding_scales"], dtype=np.float32)[:, None]
+        return meta["chunks"], vectors
+    
+    @staticmethod
+    def load_failed_ids(path: str) -> List[int]:
+        """Metadata positions listed in a failed chunks log"""
+        with open(path, "rb") as f:
+            return sorted({json.loads(line)["chunk_id"] for line in f if line.strip()})
     
     def print_summary(self):
         """Print processing summary"""
@@ -214,28 +891,47 @@ class KBChunksRebuilder:
         print(f"Successful embeddings: {self.stats['successful_embeddings']}")
         print(f"Failed embeddings: {self.stats['failed_embeddings']}")
         print(f"Skipped chunks: {self.stats['skipped_chunks']}")
+        print(f"Reused from cache: {self.stats['cached_embeddings']}")
         print(f"API calls made: {self.stats['api_calls']}")
         print(f"Processing time: {duration:.2f} seconds")
-        print(f"Average time per chunk: {duration/self.stats['total_chunks']:.2f} seconds")
+        if self.stats['total_chunks'] > 0:
+            print(f"Average time per chunk: {duration/self.stats['total_chunks']:.2f} seconds")
         
         if self.stats['api_calls'] > 0:
             avg_batch_size = self.stats['successful_embeddings'] / self.stats['api_calls']
             print(f"Average batch size: {avg_batch_size:.1f} chunks/call")
         
-        # Estimate cost (approximate)
-        tokens_estimate = self.stats['successful_embeddings'] * 500  # Rough estimate
-        cost_estimate = (tokens_estimate / 1_000_000) * 0.02  # $0.02 per 1M tokens for ada-002
-        print(f"Estimated API cost: ${cost_estimate:.4f}")
+        # Cost from the token usage the API reported
+        print(f"Tokens embedded: {self.stats['total_tokens']:,}")
+        price = EMBEDDING_PRICES.get(self.embedding_model)
+        if price is None:
+            print(f"API cost: unknown (no price listed for {self.embedding_model})")
+        else:
+            if self.use_batch_api:
+                price /= 2
+            print(f"API cost: ${self.stats['total_tokens'] * price:.4f}")
         print("="*50)
     
-    def rebuild(self):
-        """Main rebuild process"""
+    def rebuild(self, retry_failed: Optional[str] = None):
+        """
+        Main rebuild process
+        
+        Args:
+            retry_failed: Path of a failed chunks log from an earlier run. Only
+                those chunks are embedded, and they are added to the existing output.
+        """
         self.stats["start_time"] = datetime.now()
         
         try:
             # Load metadata
             metadata = self.load_metadata()
-            self.stats["total_chunks"] = len(metadata)
+            self.chunk_ids = list(range(len(metadata)))
+            
+            if retry_failed:
+                # Read the ids before the log is reopened (it may be the same file)
+                self.chunk_ids = self.load_failed_ids(retry_failed)
+                metadata = [metadata[i] for i in self.chunk_ids]
+                logger.info(f"Retrying {len(metadata)} failed chunks from {retry_failed}")
             
             # Check for existing embeddings
             existing_with_embeddings = sum(1 for chunk in metadata if "embedding" in chunk)
@@ -244,25 +940,62 @@ class KBChunksRebuilder:
                 response = input("Do you want to regenerate all embeddings? (y/n): ")
                 if response.lower() != 'y':
                     # Filter out chunks with embeddings
-                    metadata = [chunk for chunk in metadata if "embedding" not in chunk]
+                    keep = [i for i, chunk in enumerate(metadata) if "embedding" not in chunk]
+                    self.chunk_ids = [self.chunk_ids[i] for i in keep]
+                    metadata = [metadata[i] for i in keep]
                     logger.info(f"Processing {len(metadata)} chunks without embeddings")
+                else:
+                    # Chunk dicts go to the output as-is; stale vectors belong in the matrix only
+                    for chunk in metadata:
+                        chunk.pop("embedding", None)
             
+            self.stats["total_chunks"] = len(metadata)
             if not metadata:
                 logger.info("No chunks to process")
                 return
             
+            if self.cache_file:
+                self.cache = EmbeddingCache(self.cache_file)
+            self.failed_log = open(self.failed_file, "wb")
+            
             # Process chunks
-            kb_chunks, failed_chunks = self.process_chunks(metadata)
+            if self.use_batch_api:
+                kb_chunks, failed_chunks = asyncio.run(self.process_chunks_batch_api(metadata))
+            else:
+                kb_chunks, failed_chunks = asyncio.run(self.process_chunks(metadata))
+            
+            if retry_failed:
+                # Add the recovered chunks to the KB from the earlier run
+                old_chunks, old_vectors = self.load_output()
+                if kb_chunks:
+                    self.embedding_matrix = np.vstack([old_vectors, self.embedding_matrix])
+                else:
+                    self.embedding_matrix = old_vectors
+                kb_chunks = old_chunks + kb_chunks
             
             # Save results
             self.save_chunks(kb_chunks)
-            self.save_failed_chunks(failed_chunks)
+            if failed_chunks:
+                logger.warning(
+                    f"Logged {len(failed_chunks)} failed chunks to {self.failed_file}; "
+                    f"rerun with --retry-failed {self.failed_file} to retry just those"
+                )
+            
+            # Final output is safely written; the resume checkpoint is no longer needed
+            if self.checkpoint:
+                self.checkpoint.remove()
             
         except Exception as e:
             logger.error(f"Rebuild failed: {e}")
             raise
         
         finally:
+            if self.cache:
+                self.cache.close()
+            if self.failed_log:
+                self.failed_log.close()
+                if os.path.getsize(self.failed_file) == 0:
+                    os.remove(self.failed_file)
             self.stats["end_time"] = datetime.now()
             self.print_summary()
 
@@ -272,10 +1005,21 @@ def main():
     
     parser = argparse.ArgumentParser(description="Rebuild KB chunks with embeddings")
     parser.add_argument("--metadata", default="metadata.pkl", help="Input metadata file")
-    parser.add_argument("--output", default="kb_chunks/kb_chunks.pkl", help="Output KB chunks file")
+    parser.add_argument("--output", default="kb_chunks/kb_chunks.pkl", help="Output KB path; writes <base>.meta.pkl and <base>.vecs.npy")
     parser.add_argument("--model", default="text-embedding-3-small", help="Embedding model")
-    parser.add_argument("--batch-size", type=int, default=20, help="Batch size for embeddings")
+    parser.add_argument("--batch-size", type=int, default=2048, help="Max texts per embedding request")
+    parser.add_argument("--max-tokens-per-batch", type=int, default=250_000, help="Max input tokens per embedding request")
     parser.add_argument("--max-retries", type=int, default=3, help="Max retries for failed embeddings")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="Max embedding requests in flight")
+    parser.add_argument("--use-batch-api", action="store_true", help="Embed via the OpenAI Batch API (cheaper, slower)")
+    parser.add_argument("--batch-poll-interval", type=float, default=30.0, help="Seconds between Batch API status checks")
+    parser.add_argument("--emit-json", action="store_true", help="Also write a JSON copy of chunk metadata")
+    parser.add_argument("--cache-file", default=".embeddings_cache.sqlite", help="Embedding cache reused across rebuilds")
+    parser.add_argument("--no-cache", action="store_true", help="Embed every chunk, ignoring the embedding cache")
+    parser.add_argument("--dtype", choices=STORAGE_DTYPES, default="float16", help="Precision of the saved embeddings")
+    parser.add_argument("--compress-level", type=int, default=3, help="zstd level for the output (0 = uncompressed)")
+    parser.add_argument("--failed-file", default="failed_chunks.ndjson", help="Where to log chunks that could not be embedded")
+    parser.add_argument("--retry-failed", metavar="NDJSON", help="Embed only the chunks in this failed chunks log and add them to the existing output")
     
     args = parser.parse_args()
     
@@ -284,10 +1028,19 @@ def main():
         output_file=args.output,
         embedding_model=args.model,
         batch_size=args.batch_size,
-        max_retries=args.max_retries
+        max_tokens_per_batch=args.max_tokens_per_batch,
+        max_retries=args.max_retries,
+        max_concurrency=args.max_concurrency,
+        use_batch_api=args.use_batch_api,
+        batch_poll_interval=args.batch_poll_interval,
+        emit_json=args.emit_json,
+        cache_file=None if args.no_cache else args.cache_file,
+        storage_dtype=args.dtype,
+        compress_level=args.compress_level,
+        failed_file=args.failed_file
     )
     
-    rebuilder.rebuild()
+    rebuilder.rebuild(retry_failed=args.retry_failed)
 
 if __name__ == "__main__":
     main()
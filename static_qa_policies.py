@@ -0,0 +1,552 @@
+# Cheltenham College – Static QA policy entries (AUTO-GENERATED, aggressive)
+# Do not edit by hand. Re-run generate_static_qa.py to refresh.
+# Appended to the core entries by static_qa_config on first use.
+from typing import Tuple, Union
+
+KEYS: Tuple[str, ...] = (
+    "policy::13 scholarship application form 2026",
+    "policy::16 scholarship application form 2025",
+    "policy::2023 overseas schools 1",
+    "policy::admissions policy cc",
+    "policy::anti bullying p policy",
+    "policy::anti bullying policy c",
+    "policy::assistant camp co ordinator",
+    "policy::attendance and registration policy c",
+    "policy::attendance and registration policy p",
+    "policy::boarding principles p",
+    "policy::bursary policy cc",
+    "policy::bus timetable",
+    "policy::cc sept 23",
+    "policy::cc279 isi college 2023 digi",
+    "policy::cctv policy cc",
+    "policy::cctv privacy impact assessment cc policy",
+    "policy::cheltenham college isi report",
+    "policy::cheltenham college preparatory school eqi report v5 2023 05 231",
+    "policy::cheltenham prep uniform list 2023",
+    "policy::climate action plan 2024.25",
+    "policy::climate action report 2023 2024",
+    "policy::college additional costs 2025 26",
+    "policy::college dining hall menu autumn 2025",
+    "policy::college sports kit 2022 fva 180322",
+    "policy::college timeline anne cadbury room18",
+    "policy::curriculum policy c",
+    "policy::curriculum policy p",
+    "policy::dates and deadlines",
+    "policy::dining hall spring menu",
+    "policy::eal policy c",
+    "policy::eal policy p",
+    "policy::energy policy cc",
+    "policy::evensong summer 2023",
+    "policy::fees supervisor july 25",
+    "policy::first aid policy cc",
+    "policy::fourth and fifth form uniform list",
+    "policy::fv identity introduction",
+    "policy::gender pay gap statement 2024 policy",
+    "policy::guardianship policy cc",
+    "policy::health centre handbook 2023 policy",
+    "policy::health and safety cc policy",
+    "policy::house principles c",
+    "policy::humanities teacher maternity cover january 2026",
+    "policy::independent guidance on criminal records disclosure policy",
+    "policy::isi cheltenham prep 2023 digi",
+    "policy::isi intergrated inspection report cheltenham college 2016",
+    "policy::isi intergrated inspection report cheltenham prep 2016",
+    "policy::isi regulatory compliance inspection cheltenham college february 2019",
+    "policy::isi regulatory compliance inspection cheltenham prep february 2019",
+    "policy::job description",
+    "policy::job description 1",
+    "policy::key child protection and safeguarding cc policy",
+    "policy::key prep behaviour policy p",
+    "policy::key pupil behaviour policy c",
+    "policy::learning support and sen policy cc",
+    "policy::modern slavery statement policy",
+    "policy::online safety policy cc",
+    "policy::parents complaints policy cc",
+    "policy::photography and film policy cc",
+    "policy::policy",
+    "policy::privacy notice for pupils parents guardians and cheltonian society members cc policy",
+    "policy::privacy notice for staff cc policy",
+    "policy::procedure for purchase of ticket cistg 22 23 v1 policy",
+    "policy::recruitment policy cc",
+    "policy::recruitment social media checks policy v2 152",
+    "policy::relationships and sex education policy cc",
+    "policy::sixth form uniform list 2025",
+    "policy::suspension and exclusion policy cc",
+    "policy::sustainability strategy",
+    "policy::terms and conditions 2025 26",
+    "policy::the muscat cheltonian 2021 22",
+    "policy::third form uniform list",
+    "policy::together community action and charity",
+    "policy::together educational partnerships at cheltenham college",
+    "policy::valens menu autumn 2025",
+    "policy::valens spring menu",
+)
+ANSWERS: Tuple[Union[str, int], ...] = (
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+    0,
+)
+URL_PREFIX_IDS: Tuple[int, ...] = (
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    0,
+    1,
+    1,
+    1,
+    0,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+    1,
+)
+URL_SUFFIXES: Tuple[str, ...] = (
+    "2025/09/01090352/13-Scholarship-Application-Form-2026.pdf",
+    "2025/09/01090417/16-Scholarship-Application-Form-2025.pdf",
+    "2023/11/27145407/2023-Overseas-Schools-1.pdf",
+    "2025/06/24143341/Admissions-Policy-CC.pdf",
+    "2025/06/24143508/Anti-Bullying-P.pdf",
+    "2025/06/24143718/Anti-Bullying-Policy-C.pdf",
+    "2025/08/27134315/Assistant-Camp-Co-Ordinator.pdf",
+    "2025/09/08143223/Attendance-and-Registration-Policy-C.pdf",
+    "2025/09/09090834/Attendance-and-Registration-Policy-P-.pdf",
+    "2025/08/06145039/Boarding-Principles-P.pdf",
+    "2025/09/09133612/Bursary-Policy-CC.pdf",
+    "2024/09/19091752/Bus-Timetable.pdf",
+    "2023/03/30141237/CC-Sept-23.pdf",
+    "2023/06/21140127/CC279-ISI-College-2023-Digi.pdf",
+    "2024/11/27093645/CCTV-Policy-CC.pdf",
+    "2024/11/27093718/CCTV-Privacy-Impact-Assessment-CC.pdf",
+    "2023/05/24135508/Cheltenham-College-ISI-Report.pdf",
+    "2023/05/24135533/Cheltenham-College-Preparatory-School-EQI-report-v5-2023-05-231.pdf",
+    "2023/10/27142315/Cheltenham-Prep-Uniform-List-2023.pdf",
+    "2024/11/08101137/Climate-Action-Plan-2024.25.pdf",
+    "2024/09/10153304/Climate-Action-Report-2023-2024.pdf",
+    "2025/04/29124046/College-Additional-Costs-2025-26.pdf",
+    "2025/09/01144432/College-Dining-Hall-Menu-Autumn-2025.pdf",
+    "2022/03/26061259/College-Sports-Kit-2022-FVA-180322.pdf",
+    "2023/08/30121907/College-Timeline-Anne-Cadbury-Room18.pdf",
+    "2024/10/08135850/Curriculum-Policy-C.pdf",
+    "2024/10/03143650/Curriculum-Policy-P.pdf",
+    "2022/09/23142756/Dates-and-Deadlines.pdf",
+    "2025/03/06161644/Dining-Hall-Spring-menu.pdf",
+    "2025/06/09090207/EAL-Policy-C.pdf",
+    "2025/06/10080227/EAL-Policy-P.pdf",
+    "2024/02/29155318/Energy-Policy-CC.pdf",
+    "2023/05/04125841/Evensong-Summer-2023.pdf",
+    "2025/09/01152139/Fees-Supervisor-July-25.pdf",
+    "2025/03/17141231/First-Aid-Policy-CC.pdf",
+    "2025/06/12134950/Fourth-and-Fifth-Form-Uniform-List.pdf",
+    "2022/02/26061507/FV-Identity-Introduction.pdf",
+    "2025/02/04120247/Gender-Pay-Gap-Statement-2024.pdf",
+    "2025/08/29154156/Guardianship-Policy-CC.pdf",
+    "2023/04/03131918/Health-Centre-Handbook-2023.pdf",
+    "2025/05/15085800/Health-and-Safety-CC.pdf",
+    "2024/10/15115539/House-Principles-C.pdf",
+    "2025/09/02122633/Humanities-Teacher-Maternity-Cover-January-2026.pdf",
+    "2025/07/03153056/Independent-Guidance-on-Criminal-Records-Disclosure.pdf",
+    "2023/06/21135852/ISI-Cheltenham-Prep-2023-DIGI.pdf",
+    "2025/04/29132507/ISI-Intergrated-Inspection-Report-Cheltenham-College-2016.pdf",
+    "2025/04/29132511/ISI-Intergrated-Inspection-Report-Cheltenham-Prep-2016.pdf",
+    "2025/04/29132512/ISI-Regulatory-Compliance-Inspection-Cheltenham-College-February-2019.pdf",
+    "2025/04/29132513/ISI-Regulatory-Compliance-Inspection-Cheltenham-Prep-February-2019.pdf",
+    "2025/09/11104802/Job-Description.pdf",
+    "2025/09/11111128/Job-Description-1.pdf",
+    "2025/09/09091013/Key-Child-Protection-and-Safeguarding-CC.pdf",
+    "2025/06/02152901/Key-Prep-Behaviour-Policy-P.pdf",
+    "2025/06/30122253/Key-Pupil-Behaviour-Policy-C.pdf",
+    "2025/07/24104217/Learning-Support-and-SEN-Policy-CC.pdf",
+    "https://www.cheltenhamcollege.org/wp-content/uploads/2025/02/Modern-Slavery-Statement.pdf",
+    "2025/08/12130003/Online-Safety-Policy-CC.pdf",
+    "2025/01/20165219/Parents-Complaints-Policy-CC.pdf",
+    "2025/06/23121755/Photography-and-Film-Policy-CC.pdf",
+    "https://www.cheltenhamcollege.org/privacy-terms/",
+    "2024/10/08120719/Privacy-Notice-for-Pupils-Parents-Guardians-and-Cheltonian-Society-Members-CC.pdf",
+    "2025/07/03135123/Privacy-Notice-for-Staff-CC.pdf",
+    "2022/09/26135132/Procedure-for-purchase-of-ticket-CISTG-22-23-V1-.pdf",
+    "2025/07/03135121/Recruitment-Policy-CC.pdf",
+    "2023/08/24075707/Recruitment-Social-Media-Checks-Policy-v2-152.pdf",
+    "2025/03/24090958/Relationships-and-Sex-Education-Policy-CC.pdf",
+    "2025/07/08132948/Sixth-Form-Uniform-List-2025.pdf",
+    "2025/01/21101107/Suspension-and-Exclusion-Policy-CC.pdf",
+    "2024/08/22104533/Sustainability-Strategy-.pdf",
+    "2025/09/02141101/Terms-and-Conditions-2025-26.pdf",
+    "2022/09/13103404/The-Muscat-Cheltonian-2021-22.pdf",
+    "2025/06/12134926/Third-Form-Uniform-List.pdf",
+    "2021/10/26062620/Together-Community-Action-and-Charity.pdf",
+    "2021/10/26062621/Together-Educational-Partnerships-at-Cheltenham-College.pdf",
+    "2025/09/01144433/Valens-Menu-Autumn-2025.pdf",
+    "2025/03/06161703/Valens-Spring-Menu.pdf",
+)
+LABELS: Tuple[str, ...] = (
+    "13 Scholarship Application Form 2026",
+    "16 Scholarship Application Form 2025",
+    "2023 Overseas Schools 1",
+    "Admissions Policy Cc",
+    "Anti Bullying P Policy",
+    "Anti Bullying Policy C",
+    "Assistant Camp Co Ordinator",
+    "Attendance and Registration Policy C",
+    "Attendance and Registration Policy P",
+    "Boarding Principles P",
+    "Bursary Policy Cc",
+    "Bus Timetable",
+    "Cc Sept 23",
+    "Cc279 Isi College 2023 Digi",
+    "Cctv Policy Cc",
+    "Cctv Privacy Impact Assessment Cc Policy",
+    "Cheltenham College Isi Report",
+    "Cheltenham College Preparatory School Eqi Report V5 2023 05 231",
+    "Cheltenham Prep Uniform List 2023",
+    "Climate Action Plan 2024.25",
+    "Climate Action Report 2023 2024",
+    "College Additional Costs 2025 26",
+    "College Dining Hall Menu Autumn 2025",
+    "College Sports Kit 2022 Fva 180322",
+    "College Timeline Anne Cadbury Room18",
+    "Curriculum Policy C",
+    "Curriculum Policy P",
+    "Dates and Deadlines",
+    "Dining Hall Spring Menu",
+    "Eal Policy C",
+    "Eal Policy P",
+    "Energy Policy Cc",
+    "Evensong Summer 2023",
+    "Fees Supervisor July 25",
+    "First Aid Policy Cc",
+    "Fourth and Fifth Form Uniform List",
+    "Fv Identity Introduction",
+    "Gender Pay Gap Statement 2024 Policy",
+    "Guardianship Policy Cc",
+    "Health Centre Handbook 2023 Policy",
+    "Health and Safety Cc Policy",
+    "House Principles C",
+    "Humanities Teacher Maternity Cover January 2026",
+    "Independent Guidance on Criminal Records Disclosure Policy",
+    "Isi Cheltenham Prep 2023 Digi",
+    "Isi Intergrated Inspection Report Cheltenham College 2016",
+    "Isi Intergrated Inspection Report Cheltenham Prep 2016",
+    "Isi Regulatory Compliance Inspection Cheltenham College February 2019",
+    "Isi Regulatory Compliance Inspection Cheltenham Prep February 2019",
+    "Job Description",
+    "Job Description 1",
+    "Key Child Protection and Safeguarding Cc Policy",
+    "Key Prep Behaviour Policy P",
+    "Key Pupil Behaviour Policy C",
+    "Learning Support and Sen Policy Cc",
+    "Modern Slavery Statement Policy",
+    "Online Safety Policy Cc",
+    "Parents Complaints Policy Cc",
+    "Photography and Film Policy Cc",
+    "Policy",
+    "Privacy Notice for Pupils Parents Guardians and Cheltonian Society Members Cc Policy",
+    "Privacy Notice for Staff Cc Policy",
+    "Procedure for Purchase of Ticket Cistg 22 23 V1 Policy",
+    "Recruitment Policy Cc",
+    "Recruitment Social Media Checks Policy V2 152",
+    "Relationships and Sex Education Policy Cc",
+    "Sixth Form Uniform List 2025",
+    "Suspension and Exclusion Policy Cc",
+    "Sustainability Strategy",
+    "Terms and Conditions 2025 26",
+    "The Muscat Cheltonian 2021 22",
+    "Third Form Uniform List",
+    "Together Community Action and Charity",
+    "Together Educational Partnerships At Cheltenham College",
+    "Valens Menu Autumn 2025",
+    "Valens Spring Menu",
+)
+VARIANTS_BLOB: str = (
+    "policy scholarship application form\x0013 scholarship application form 2026\x00scholarship application form\x00"
+    "16 scholarship application form 2025\x00policy scholarship application form\x00scholarship application form\x00"
+    "policy overseas schools\x002023 overseas schools 1\x00overseas schools\x00"
+    "admissions cc\x00admissions policy cc\x00policy admissions cc\x00"
+    "anti bullying p policy\x00anti bullying p\x00policy anti bullying p\x00"
+    "anti bullying c\x00anti bullying policy c\x00policy anti bullying c\x00"
+    "policy assistant camp co ordinator\x00assistant camp co ordinator\x00"
+    "attendance and registration c\x00policy attendance and registration c\x00attendance and registration policy c\x00"
+    "attendance and registration p\x00policy attendance and registration p\x00attendance and registration policy p\x00"
+    "policy boarding principles p\x00boarding principles p\x00"
+    "bursary policy cc\x00bursary cc\x00policy bursary cc\x00"
+    "bus timetable\x00policy bus timetable\x00"
+    "cc sept 23\x00cc sept\x00policy cc sept\x00"
+    "cc279 isi college 2023 digi\x00policy cc isi college digi\x00cc isi college digi\x00"
+    "cctv cc\x00policy cctv cc\x00cctv policy cc\x00"
+    "cctv privacy impact assessment cc policy\x00cctv privacy impact assessment cc\x00policy cctv privacy impact assessment cc\x00"
+    "policy cheltenham college isi report\x00cheltenham college isi report\x00"
+    "cheltenham college preparatory school eqi report v5 2023 05 231\x00policy cheltenham college preparatory school eqi report v\x00cheltenham college preparatory school eqi report v\x00"
+    "policy cheltenham prep uniform list\x00cheltenham prep uniform list\x00cheltenham prep uniform list 2023\x00"
+    "policy climate action plan\x00climate action plan\x00climate action plan 2024.25\x00"
+    "climate action report 2023 2024\x00climate action report\x00policy climate action report\x00"
+    "college additional costs 2025 26\x00college additional costs\x00policy college additional costs\x00"
+    "college dining hall menu autumn\x00college dining hall menu autumn 2025\x00policy college dining hall menu autumn\x00"
+    "policy college sports kit fva\x00college sports kit 2022 fva 180322\x00college sports kit fva\x00"
+    "college timeline anne cadbury room\x00policy college timeline anne cadbury room\x00college timeline anne cadbury room18\x00"
+    "policy curriculum c\x00curriculum c\x00curriculum policy c\x00"
+    "curriculum policy p\x00policy curriculum p\x00curriculum p\x00"
+    "dates and deadlines\x00policy dates and deadlines\x00"
+    "policy dining hall spring menu\x00dining hall spring menu\x00"
+    "policy eal c\x00eal c\x00eal policy c\x00"
+    "eal p\x00policy eal p\x00eal policy p\x00"
+    "energy cc\x00energy policy cc\x00policy energy cc\x00"
+    "evensong summer\x00evensong summer 2023\x00policy evensong summer\x00"
+    "fees supervisor july\x00fees supervisor july 25\x00policy fees supervisor july\x00"
+    "first aid cc\x00policy first aid cc\x00first aid policy cc\x00"
+    "fourth and fifth form uniform list\x00policy fourth and fifth form uniform list\x00"
+    "policy fv identity introduction\x00fv identity introduction\x00"
+    "gender pay gap statement policy\x00policy gender pay gap statement\x00gender pay gap statement\x00gender pay gap statement 2024 policy\x00"
+    "policy guardianship cc\x00guardianship cc\x00guardianship policy cc\x00"
+    "policy health centre handbook\x00health centre handbook policy\x00health centre handbook\x00health centre handbook 2023 policy\x00"
+    "health and safety cc policy\x00policy health and safety cc\x00health and safety cc\x00"
+    "policy house principles c\x00house principles c\x00"
+    "policy humanities teacher maternity cover january\x00humanities teacher maternity cover january\x00humanities teacher maternity cover january 2026\x00"
+    "independent guidance on criminal records disclosure policy\x00independent guidance on criminal records disclosure\x00policy independent guidance on criminal records disclosure\x00"
+    "policy isi cheltenham prep digi\x00isi cheltenham prep 2023 digi\x00isi cheltenham prep digi\x00"
+    "isi intergrated inspection report cheltenham college\x00isi intergrated inspection report cheltenham college 2016\x00policy isi intergrated inspection report cheltenham college\x00"
+    "isi intergrated inspection report cheltenham prep\x00policy isi intergrated inspection report cheltenham prep\x00isi intergrated inspection report cheltenham prep 2016\x00"
+    "isi regulatory compliance inspection cheltenham college february\x00policy isi regulatory compliance inspection cheltenham college february\x00isi regulatory compliance inspection cheltenham college february 2019\x00"
+    "isi regulatory compliance inspection cheltenham prep february\x00policy isi regulatory compliance inspection cheltenham prep february\x00isi regulatory compliance inspection cheltenham prep february 2019\x00"
+    "job description\x00policy job description\x00"
+    "job description\x00job description 1\x00policy job description\x00"
+    "policy key child protection and safeguarding cc\x00key child protection and safeguarding cc\x00key child protection and safeguarding cc policy\x00"
+    "key prep behaviour p\x00policy key prep behaviour p\x00key prep behaviour policy p\x00"
+    "key pupil behaviour c\x00key pupil behaviour policy c\x00policy key pupil behaviour c\x00"
+    "learning support and sen cc\x00learning support and sen policy cc\x00policy learning support and sen cc\x00"
+    "modern slavery statement\x00modern slavery statement policy\x00policy modern slavery statement\x00"
+    "online safety cc\x00policy online safety cc\x00online safety policy cc\x00"
+    "parents complaints cc\x00policy parents complaints cc\x00parents complaints policy cc\x00"
+    "photography and film policy cc\x00policy photography and film cc\x00photography and film cc\x00"
+    "policy\x00policy policy\x00"
+    "privacy notice for pupils parents guardians and cheltonian society members cc policy\x00policy privacy notice for pupils parents guardians and cheltonian society members cc\x00privacy notice for pupils parents guardians and cheltonian society members cc\x00"
+    "privacy notice for staff cc policy\x00policy privacy notice for staff cc\x00privacy notice for staff cc\x00"
+    "policy procedure for purchase of ticket cistg v\x00procedure for purchase of ticket cistg v policy\x00procedure for purchase of ticket cistg v\x00procedure for purchase of ticket cistg 22 23 v1 policy\x00"
+    "policy recruitment cc\x00recruitment policy cc\x00recruitment cc\x00"
+    "recruitment social media checks v\x00policy recruitment social media checks v\x00recruitment social media checks policy v2 152\x00recruitment social media checks policy v\x00"
+    "relationships and sex education cc\x00policy relationships and sex education cc\x00relationships and sex education policy cc\x00"
+    "sixth form uniform list 2025\x00policy sixth form uniform list\x00sixth form uniform list\x00"
+    "suspension and exclusion cc\x00policy suspension and exclusion cc\x00suspension and exclusion policy cc\x00"
+    "policy sustainability strategy\x00sustainability strategy\x00"
+    "terms and conditions\x00terms and conditions 2025 26\x00policy terms and conditions\x00"
+    "the muscat cheltonian\x00the muscat cheltonian 2021 22\x00policy the muscat cheltonian\x00"
+    "third form uniform list\x00policy third form uniform list\x00"
+    "policy together community action and charity\x00together community action and charity\x00"
+    "policy together educational partnerships at cheltenham college\x00together educational partnerships at cheltenham college\x00"
+    "policy valens menu autumn\x00valens menu autumn 2025\x00valens menu autumn\x00"
+    "policy valens spring menu\x00valens spring menu\x00"
+)
+VARIANT_OFFSETS: Tuple[int, ...] = (
+    0,
+    102,
+    204,
+    269,
+    325,
+    387,
+    449,
+    512,
+    616,
+    720,
+    771,
+    818,
+    853,
+    887,
+    962,
+    1000,
+    1116,
+    1183,
+    1356,
+    1455,
+    1530,
+    1613,
+    1703,
+    1811,
+    1899,
+    2013,
+    2066,
+    2119,
+    2166,
+    2221,
+    2253,
+    2285,
+    2329,
+    2389,
+    2462,
+    2515,
+    2592,
+    2649,
+    2775,
+    2837,
+    2955,
+    3032,
+    3077,
+    3218,
+    3388,
+    3475,
+    3646,
+    3808,
+    4015,
+    4213,
+    4252,
+    4309,
+    4446,
+    4523,
+    4603,
+    4701,
+    4790,
+    4855,
+    4935,
+    5021,
+    5042,
+    5290,
+    5388,
+    5580,
+    5639,
+    5801,
+    5920,
+    6004,
+    6102,
+    6157,
+    6235,
+    6316,
+    6371,
+    6454,
+    6573,
+    6642,
+    6687,
+)
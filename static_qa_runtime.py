@@ -0,0 +1,339 @@
+"""
+Runtime for the static QA configs written by generate_static_qa.py.
+
+A generated config only holds data: its core columns, URL prefixes, answer
+templates and the (key prefix, module) table of its shards. It builds one
+StaticQATable over that data and re-exports the table's lookups, so callers
+keep using the config module itself (static_qa.resolve(...), static_qa.KEYS).
+"""
+
+import os, sys, pickle, hashlib, importlib
+from array import array
+from collections import deque
+from functools import cache, cached_property, lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence, Tuple, Union
+
+# Column names shared by a config's CORE_* columns, its shard modules and
+# their pickle sidecars
+COLUMN_NAMES = ("KEYS", "ANSWERS", "URL_PREFIX_IDS", "URL_SUFFIXES", "LABELS", "VARIANTS_BLOB", "VARIANT_OFFSETS")
+
+def normalise(phrase: str) -> str:
+    """Lowercase and collapse runs of whitespace, the form phrases are matched in."""
+    return " ".join(phrase.lower().split())
+
+class StaticQA(NamedTuple):
+    """One entry as a row. Every entry is in the config's LANGUAGE, so there is no language field."""
+    key: str
+    answer: str
+    url: str
+    label: str
+    variants: Tuple[str, ...]
+
+class Columns(NamedTuple):
+    """The full columns (core entries, then each shard's entries) and their indexes."""
+    keys: Tuple[str, ...]
+    answers: Tuple[Union[str, int], ...]
+    url_prefix_ids: array
+    url_suffixes: Tuple[str, ...]
+    labels: Tuple[str, ...]
+    variants_blob: str
+    variant_offsets: array
+    key_index: Dict[str, int]
+    variant_index: Dict[str, int]
+
+# Module attributes a config serves from StaticQATable.columns, e.g. KEYS
+LAZY_COLUMNS = frozenset(name.upper() for name in Columns._fields)
+
+def load_shard(directory: str, module: str) -> Dict[str, Any]:
+    """
+    A shard's columns from the pickle sidecar next to its module while it
+    matches the module source (so a cold start skips compiling the literals),
+    otherwise from the module itself.
+    """
+    base = os.path.join(directory, module)
+    try:
+        with open(base + ".py", "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        with open(base + ".pkl", "rb") as f:
+            blob = pickle.load(f)
+        if blob["source_hash"] == digest:
+            return blob["columns"]
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError):
+        pass
+    shard = importlib.import_module(module)
+    return {name: getattr(shard, name) for name in COLUMN_NAMES}
+
+class StaticQATable:
+    """
+    Lookups over one generated config. The full columns and every index over
+    them only exist once something asks for them, so importing a config costs
+    no more than unmarshalling its literals.
+    """
+
+    def __init__(self,
+                 module_name: str,
+                 directory: str,
+                 core: Mapping[str, Sequence],
+                 shards: Sequence[Tuple[str, str]],
+                 url_prefixes: Sequence[str],
+                 answer_templates: Sequence[str],
+                 language: str):
+        """
+        Args:
+            module_name: The config's __name__, for AttributeError messages
+            directory: Directory the config and its shard modules live in
+            core: The config's CORE_* columns, by COLUMN_NAMES name
+            shards: (key prefix, module) for each shard appended after the core columns, in order
+            url_prefixes: URL_PREFIXES; entry i's URL is url_prefixes[URL_PREFIX_IDS[i]] + URL_SUFFIXES[i]
+            answer_templates: ANSWER_TEMPLATES, filled with the label for entries whose ANSWERS slot is an index
+            language: The one language every entry is in
+        """
+        self.module_name = module_name
+        self.directory = directory
+        self.core = core
+        self.shards = tuple(shards)
+        self.url_prefixes = url_prefixes
+        self.answer_templates = answer_templates
+        self.language = language
+        # Per table rather than @cache on the methods, which would keep every
+        # table alive from one module-wide cache
+        self.load_shard = cache(lambda module: load_shard(self.directory, module))
+        self.get_entry = cache(self._get_entry)
+        # Keyed on the raw query: a repeat of a hot query ("rugby") skips even
+        # normalise(), and equivalent spellings just take a slot each.
+        self.lookup = lru_cache(maxsize=2048)(self._lookup)
+
+    @cached_property
+    def columns(self) -> Columns:
+        """
+        The full columns and their indexes, built on first use. Everything is
+        built in locals and stored in one step, so a request thread never sees
+        KEYS without a finished VARIANT_INDEX.
+        """
+        core = self.core
+        keys, answers, url_suffixes, labels = (
+            tuple(core["KEYS"]), tuple(core["ANSWERS"]), tuple(core["URL_SUFFIXES"]), tuple(core["LABELS"])
+        )
+        # Prefix ids fit unsigned bytes up to 256 prefixes; wider past that
+        n_prefixes = len(self.url_prefixes)
+        url_prefix_ids = array("B" if n_prefixes <= 0x100 else "H" if n_prefixes <= 0x10000 else "I", core["URL_PREFIX_IDS"])
+        # Entry i's variants are VARIANTS_BLOB[VARIANT_OFFSETS[i]:VARIANT_OFFSETS[i + 1]];
+        # a flat unsigned array holds the boundaries at 4 bytes each.
+        blobs = [core["VARIANTS_BLOB"]]
+        variant_offsets = array("I", core["VARIANT_OFFSETS"])
+        for _prefix, module in self.shards:
+            shard = self.load_shard(module)
+            keys += tuple(shard["KEYS"])
+            answers += tuple(shard["ANSWERS"])
+            url_prefix_ids.extend(shard["URL_PREFIX_IDS"])
+            url_suffixes += tuple(shard["URL_SUFFIXES"])
+            labels += tuple(shard["LABELS"])
+            offset = variant_offsets[-1]
+            blobs.append(shard["VARIANTS_BLOB"])
+            variant_offsets.extend(o + offset for o in shard["VARIANT_OFFSETS"][1:])
+
+        # Intern the short key/label strings; the index below shares them.
+        keys = tuple(map(sys.intern, keys))
+        labels = tuple(map(sys.intern, labels))
+        variants_blob = "".join(blobs)
+
+        # Normalised key/variant phrase -> position. The first entry listing a
+        # phrase wins, and insertion follows entry order (key, then variants), so
+        # iterating .items() visits phrases as a front-to-back scan would.
+        # A plain dict on purpose: a generated perfect hash (G table + seeded
+        # hashes) has to run its hash functions in Python and measured ~4x slower
+        # per lookup than dict.get, whose str hash is cached on the interned key.
+        variant_index: Dict[str, int] = {}
+        for i, key in enumerate(keys):
+            variant_index.setdefault(sys.intern(normalise(key)), i)
+            for v in variants_blob[variant_offsets[i]:variant_offsets[i + 1]].split("\0")[:-1]:
+                variant_index.setdefault(sys.intern(v), i)
+
+        return Columns(
+            keys, answers, url_prefix_ids, url_suffixes, labels, variants_blob, variant_offsets,
+            # key -> position in the columns
+            {k: i for i, k in enumerate(keys)},
+            variant_index,
+        )
+
+    def module_attribute(self, name: str) -> Any:
+        """The config's lazily built module attributes (PEP 562 __getattr__)."""
+        if name in LAZY_COLUMNS:
+            return getattr(self.columns, name.lower())
+        if name == "STATIC_QA_LIST":
+            return self.rows
+        if name == "URLS":
+            return self.urls
+        raise AttributeError(f"module {self.module_name!r} has no attribute {name!r}")
+
+    @cached_property
+    def rows(self) -> Tuple[StaticQA, ...]:
+        """STATIC_QA_LIST: every entry as a StaticQA row, built on first access."""
+        return tuple(self.get_entry(i) for i in range(len(self.columns.keys)))
+
+    def _get_entry(self, i: int) -> StaticQA:
+        """
+        Row view of entry i, for callers that need every field at once. Rows are
+        immutable, so each is built once and shared.
+        """
+        return StaticQA(self.columns.keys[i], self.answer_of(i), self.url(i), self.columns.labels[i], self.variants_of(i))
+
+    def entry(self, i: int) -> Dict[str, Any]:
+        """Entry i as a fresh dict in the old STATIC_QA_LIST shape, for call sites still using dicts."""
+        row = self.get_entry(i)
+        return {
+            "key": row.key,
+            "language": self.language,
+            "answer": row.answer,
+            "url": row.url,
+            "label": row.label,
+            "variants": list(row.variants),
+        }
+
+    def get_language(self, entry: Any = None) -> str:
+        """Language of an entry. Entries carry no language field; all are LANGUAGE."""
+        return self.language
+
+    def answer_of(self, i: int) -> str:
+        """Answer of entry i; an int in ANSWERS picks an ANSWER_TEMPLATES entry, filled with the label."""
+        columns = self.columns
+        answer = columns.answers[i]
+        return self.answer_templates[answer].format(label=columns.labels[i]) if isinstance(answer, int) else answer
+
+    def variants_of(self, i: int) -> Tuple[str, ...]:
+        """Variants of entry i, sliced out of VARIANTS_BLOB on demand."""
+        columns = self.columns
+        return tuple(columns.variants_blob[columns.variant_offsets[i]:columns.variant_offsets[i + 1]].split("\0")[:-1])
+
+    def url(self, i: int) -> str:
+        """URL of entry i, its shared prefix and own suffix joined on demand."""
+        # Id 0 is the empty prefix, and "" + s is s itself, so whole URLs (shared
+        # with PAGE_LINKS) come back as the same object rather than a copy.
+        columns = self.columns
+        return self.url_prefixes[columns.url_prefix_ids[i]] + columns.url_suffixes[i]
+
+    @cached_property
+    def urls(self) -> Tuple[str, ...]:
+        """URLS: every entry's full URL, built on first access."""
+        return tuple(self.url(i) for i in range(len(self.columns.keys)))
+
+    @cached_property
+    def core_key_index(self) -> Dict[str, int]:
+        return {k: i for i, k in enumerate(self.core["KEYS"])}
+
+    def index_of(self, key: str) -> Optional[int]:
+        """
+        Position of the entry with this key, else None. Dispatches on the key's
+        prefix: keys outside every shard prefix are core entries, which sit at the
+        same positions before and after the shards load, so no shard is loaded.
+        """
+        if any(key.startswith(prefix) for prefix, _module in self.shards):
+            return self.columns.key_index.get(key)
+        return self.core_key_index.get(key)
+
+    @cached_property
+    def trie(self) -> Dict[Any, Any]:
+        """
+        Nested-dict trie over every normalised key/variant, built on first use.
+        A node's None slot holds the entry index of the phrase ending there; the
+        first entry listing a phrase wins, as in VARIANT_INDEX.
+        """
+        root: Dict[Any, Any] = {}
+        for phrase, i in self.columns.variant_index.items():
+            if not phrase:
+                continue
+            node = root
+            for ch in phrase:
+                node = node.setdefault(ch, {})
+            node.setdefault(None, i)
+        return root
+
+    def _walk(self, text: str) -> Optional[Dict[Any, Any]]:
+        node = self.trie
+        for ch in text:
+            node = node.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def _lookup(self, query: str) -> Optional[int]:
+        """Index of the entry whose key or a variant equals query once normalised, else None."""
+        # One hash probe decides hits and misses alike. VARIANT_INDEX holds the
+        # same normalised phrases as the trie, with the same first-entry-wins
+        # precedence, and a dict probe is 2-3x cheaper than walking the trie one
+        # character at a time. The trie is only needed for prefixes (complete).
+        return self.columns.variant_index.get(normalise(query))
+
+    def complete(self, prefix: str, limit: int = 10) -> List[int]:
+        """Up to limit entry indices, in entry order, with a key/variant starting with prefix."""
+        node = self._walk(normalise(prefix))
+        found, stack = set(), [node] if node is not None else []
+        while stack:
+            for ch, child in stack.pop().items():
+                if ch is None:
+                    found.add(child)
+                else:
+                    stack.append(child)
+        return sorted(found)[:limit]
+
+    def resolve(self, phrase: str) -> Optional[StaticQA]:
+        """Entry whose key or a variant equals phrase (see lookup), else None."""
+        i = self.lookup(phrase)
+        return None if i is None else self.get_entry(i)
+
+    @cached_property
+    def automaton(self) -> Tuple[Tuple[Dict[str, int], ...], Tuple[int, ...], Tuple[Tuple[Tuple[int, str], ...], ...]]:
+        """Aho-Corasick goto/fail/output tables over VARIANT_INDEX, built on first match()."""
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[Tuple[int, str]]] = [[]]
+        for phrase, i in self.columns.variant_index.items():
+            if not phrase:
+                continue
+            node = 0
+            for ch in phrase:
+                nxt = goto[node].get(ch)
+                if nxt is None:
+                    nxt = goto[node][ch] = len(goto)
+                    goto.append({})
+                    out.append([])
+                node = nxt
+            out[node].append((i, phrase))
+
+        # Breadth-first, so a node's fail target is always finished before it
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in goto[node].items():
+                queue.append(nxt)
+                f = fail[node]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        # Frozen once built; the tables are shared by every later match() call
+        return tuple(goto), tuple(fail), tuple(map(tuple, out))
+
+    def match(self, text: str) -> Iterator[Tuple[int, str]]:
+        """
+        Yield (entry index, phrase) for every key/variant occurring in text
+        (case-insensitive) as whole words, in a single pass over text. A hit
+        counts only with a non-alphanumeric character or the end of text on both
+        sides, so "sen" is not found in "present".
+        """
+        goto, fail, out = self.automaton
+        text = text.lower()
+        node = 0
+        for end, ch in enumerate(text, 1):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node] and (end == len(text) or not text[end].isalnum()):
+                for i, phrase in out[node]:
+                    start = end - len(phrase)
+                    if start == 0 or not text[start - 1].isalnum():
+                        yield i, phrase
+
+    def match_all(self, query: str) -> List[StaticQA]:
+        """Entries with a key/variant occurring as whole words in query, each once, in order of first occurrence."""
+        return [self.get_entry(i) for i in dict.fromkeys(i for i, _phrase in self.match(normalise(query)))]
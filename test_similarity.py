@@ -1,18 +1,19 @@
-import pickle
 import numpy as np
 from numpy import dot
 from numpy.linalg import norm
 from openai import OpenAI
 from dotenv import load_dotenv
 import os
+from kb_store import load_kb
 
 # ─── Load OpenAI API key ─────────────────────────────
 load_dotenv()
 client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
 # ─── Load Embedded Chunks ─────────────────────────────
-with open("kb_chunks/kb_chunks.pkl", "rb") as f:
-    chunks = pickle.load(f)
+chunks, embeddings = load_kb("kb_chunks/kb_chunks")
+for chunk, vec in zip(chunks, embeddings):
+    chunk["embedding"] = vec
 
 print(f"✅ Loaded {len(chunks)} embedded chunks")
 